@@ -43,10 +43,32 @@ if not TWILIO_ACCOUNT_SID or not TWILIO_AUTH_TOKEN or not TWILIO_NUMBER:
     st.warning("⚠️ Warning: Twilio credentials not fully configured. WhatsApp notifications for support tickets may not work.")
 
 # --- Database Client Initialization ---
+@st.cache_resource(show_spinner=False)
+def get_mongo_client():
+    """Caches the MongoClient so its connection pool survives reruns instead of reconnecting each time."""
+    # tz_aware/tzinfo as in the dashboard, so both apps read the same ticket dates as aware UTC datetimes
+    return MongoClient(MONGO_URI, maxPoolSize=20, serverSelectionTimeoutMS=5000, appname="apiman-chatbot",
+                       tz_aware=True, tzinfo=timezone.utc)
+
+@st.cache_resource(show_spinner=False)
+def migrate_ticket_dates(_tickets_collection):
+    """Converts legacy ISO-string ticket dates to native BSON dates, once per process.
+
+    Runs here as well as in the dashboard: the two apps start independently, and string and date
+    values sort in separate BSON type brackets, so the recent-tickets order is only right once
+    every ticket holds a real date."""
+    for field in ("created_at", "closed_at", "last_updated"):
+        # $convert rather than $toDate: a malformed legacy string is left as-is instead of failing the whole update
+        _tickets_collection.update_many({field: {"$type": "string"}}, [{"$set": {field: {
+            "$convert": {"input": f"${field}", "to": "date", "onError": f"${field}", "onNull": None}
+        }}}])
+    return True
+
 try:
-    mongo_client = MongoClient(MONGO_URI)
+    mongo_client = get_mongo_client()
     db = mongo_client["apiman"]
     tickets_collection = db["support_tickets"]
+    migrate_ticket_dates(tickets_collection)
     api_logs_collection = db["api_usage_logs"] # Still here for context, though not heavily used
 except Exception as e:
     st.error(f"❌ Database Connection Failed: Could not connect to MongoDB. Please check your MONGO_URI. Error: {e}")
@@ -88,12 +110,13 @@ def create_support_ticket(query_text, contact_info="anonymous user"):
     """
     Creates a new support ticket in MongoDB and sends a WhatsApp notification.
     """
+    now = datetime.now(timezone.utc) # Stored as native BSON dates so the dashboard can sort and age tickets server-side
     ticket_data = {
         "query": query_text,
         "contact": contact_info,
         "status": "open",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "last_updated": datetime.now(timezone.utc).isoformat()
+        "created_at": now,
+        "last_updated": now
     }
     try:
         result = tickets_collection.insert_one(ticket_data)
@@ -135,11 +158,18 @@ def _get_recent_tickets_markdown():
                 subject = t["query"].split('\n')[0]
                 if len(subject) > 50:
                     subject = subject[:47] + "..."
+                # A ticket written by an older build after the migration ran may still carry an ISO string
+                created = t["created_at"]
+                if isinstance(created, str):
+                    try:
+                        created = datetime.fromisoformat(created)
+                    except ValueError:
+                        pass # Unparseable legacy value (the migration leaves these alone): shown as stored
                 ticket_records.append({
                     "ID": str(t["_id"])[-6:], # Show last 6 chars of ID for brevity
                     "Subject": subject,
                     "Status": t["status"].capitalize(),
-                    "Created": datetime.fromisoformat(t["created_at"]).strftime("%Y-%m-%d %H:%M")
+                    "Created": created.strftime("%Y-%m-%d %H:%M") if isinstance(created, datetime) else created
                 })
             recent_tickets_df = pd.DataFrame(ticket_records)
             # Convert DataFrame to Markdown table
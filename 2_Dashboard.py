@@ -1,28 +1,112 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+from pandas.api.types import union_categoricals
 import plotly.graph_objects as go
 from pymongo import MongoClient
-from datetime import datetime, timedelta
+from pymongo.errors import OperationFailure
+from datetime import datetime, timedelta, timezone, time
 from dotenv import load_dotenv
 import os
 import numpy as np
+import random # Cheap scalar draws for the simulated health card
 import uuid # For generating API keys
+import zlib # Stable per-name seeds for the dummy RNG
+import textwrap # Dedent HTML chunks that are batched into one st.markdown call
+import functools
+import html # Escape user-supplied ticket text before it goes into card HTML
+import threading # Background change-stream watcher for the ticket caches
+import time as time_module # File mtimes for the on-disk cache (the name `time` is datetime.time)
+import logging # The ticket watcher runs off the script thread, so its errors go to the server log
 
 # Load environment variables
 load_dotenv()
 
+@functools.lru_cache(maxsize=1) # plotly.express is heavy to import; pay for it on the first chart, not at startup
+def _px():
+    import plotly.express as px
+    return px
+
+# Copy-on-write: slices and filtered frames share memory until written to, so no defensive .copy() is needed
+pd.options.mode.copy_on_write = True
+
+logger = logging.getLogger(__name__)
+
 # MongoDB Connection
 mongo_uri = os.getenv("MONGODB_URI")
+UTC = timezone.utc # All timestamps are handled as tz-aware UTC, from the driver through pandas
+
+@st.cache_resource(show_spinner=False) # One pooled client per process, reused across reruns and sessions
+def get_mongo():
+    return MongoClient(mongo_uri, maxPoolSize=20, serverSelectionTimeoutMS=5000, appname="apiman-dashboard",
+                       tz_aware=True, tzinfo=UTC) # appname tags ops in the server profiler
+
+@st.cache_resource(show_spinner=False) # create_index is idempotent, but only needs to run once per process
+def ensure_indexes(_logs_collection, _api_keys_collection, _tickets_collection):
+    _logs_collection.create_index([("timestamp", 1)]) # Date-range $match in find() and the daily aggregation
+    _logs_collection.create_index([("api", 1), ("timestamp", 1)]) # Per-API lookups within a date range
+    _api_keys_collection.create_index([("user_id", 1), ("api", 1)])
+    _tickets_collection.create_index([("status", 1), ("created_at", 1)]) # Open tickets, oldest first
+    _tickets_collection.create_index([("status", 1), ("closed_at", -1)]) # Most recently closed tickets
+    _tickets_collection.create_index([("created_at", -1)]) # The chatbot's recent-tickets list sorts across all statuses
+    return True
+
+@st.cache_resource(show_spinner=False) # One-off per process; later runs match no string-typed fields
+def migrate_ticket_dates(_tickets_collection):
+    # Tickets used to store ISO strings; convert them in place to native BSON dates
+    for field in ("created_at", "closed_at", "last_updated"):
+        # $convert rather than $toDate: a malformed legacy string is left as-is instead of failing the whole update
+        _tickets_collection.update_many({field: {"$type": "string"}}, [{"$set": {field: {
+            "$convert": {"input": f"${field}", "to": "date", "onError": f"${field}", "onNull": None}
+        }}}])
+    return True
+
+CHANGE_STREAM_UNSUPPORTED = {40573, 40324} # Standalone server / server without $changeStream: the only permanent failures
+CHANGE_STREAM_HISTORY_LOST = 286
+
+@st.cache_resource(show_spinner=False) # One watcher thread per process, shared by every session
+def start_ticket_watcher(_tickets_collection):
+    # Set by the change stream whenever a ticket is written; the page clears the ticket caches on its next run
+    changed = threading.Event()
+    pipeline = [{"$match": {"operationType": {"$in": ["insert", "update", "replace", "delete"]}}}]
+    def watch():
+        resume_token = None
+        backoff = 1
+        while True:
+            try:
+                with _tickets_collection.watch(pipeline, resume_after=resume_token) as stream:
+                    backoff = 1
+                    for _ in stream:
+                        resume_token = stream.resume_token
+                        changed.set()
+                resume_token = None # The stream was invalidated (e.g. collection dropped); start a fresh one
+            except OperationFailure as e:
+                if e.code in CHANGE_STREAM_UNSUPPORTED:
+                    logger.info("Ticket change stream unavailable (%s); falling back to cache TTLs", e)
+                    return
+                if e.code == CHANGE_STREAM_HISTORY_LOST:
+                    resume_token = None # The oplog has moved past the token; resume from now instead
+                logger.warning("Ticket change stream failed; retrying in %ss", backoff, exc_info=True)
+            except Exception:
+                # Network errors, stepdowns and anything else: the thread must not die, so reconnect and
+                # resume from the last seen event
+                logger.warning("Ticket change stream failed; retrying in %ss", backoff, exc_info=True)
+            changed.set() # Writes may have been missed while the stream was down
+            time_module.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+    threading.Thread(target=watch, name="ticket-watcher", daemon=True).start()
+    return changed
 
 try:
-    client = MongoClient(mongo_uri)
+    client = get_mongo()
     db = client["apiman"]
     logs_collection = db["api_usage_logs"]
     tickets_collection = db["support_tickets"]
     # New collections for API Keys and Users
     api_keys_collection = db["api_keys"] 
     users_collection = db["users"] 
+    ensure_indexes(logs_collection, api_keys_collection, tickets_collection)
+    migrate_ticket_dates(tickets_collection)
+    tickets_changed = start_ticket_watcher(tickets_collection)
 except Exception as e:
     st.error(f"Could not connect to MongoDB: {e}")
     st.stop()
@@ -30,6 +114,16 @@ except Exception as e:
 
 st.set_page_config(layout="wide", page_title="API Admin Dashboard", initial_sidebar_state="collapsed")
 
+# --- Custom CSS for a stunning UI ---
+@st.cache_resource(show_spinner=False) # The sheet lives in static/dashboard.css; read it once per process, not per rerun
+def dashboard_css():
+    # Inlined rather than <link>ed: Streamlit's static route serves .css as text/plain + nosniff, which browsers refuse
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "dashboard.css"), encoding="utf-8") as f:
+        return f"<style>{f.read()}</style>"
+
+# Emitted on every run: an element skipped on a rerun is removed from the page along with its styles.
+st.markdown(dashboard_css(), unsafe_allow_html=True)
+
 # --- Configuration for APIs (Enhanced) ---
 API_CONFIGS = {
     "Image API": {
@@ -118,6 +212,23 @@ API_CONFIGS = {
     }
 }
 
+COST_MAP = {name: cfg["cost_per_call"] for name, cfg in API_CONFIGS.items()} # api -> cost, for vectorized .map()
+# api -> (base latency, latency variation, base error rate, error rate variation), unpacked in one step by get_api_health
+HEALTH_PARAMS = {name: (cfg.get("base_latency_ms", 50), cfg.get("latency_variation", 20),
+                        cfg.get("base_error_rate_percent", 0.5), cfg.get("error_rate_variation", 0.5))
+                 for name, cfg in API_CONFIGS.items()}
+DEFAULT_HEALTH_PARAMS = (50, 20, 0.5, 0.5)
+
+# Simple dummy lat/long for countries for a basic map, split into per-axis maps for Series.map()
+COUNTRY_COORDS = {
+    "USA": (37.0902, -95.7129), "Germany": (51.1657, 10.4515), "India": (20.5937, 78.9629),
+    "Brazil": (-14.2350, -51.9253), "Japan": (36.2048, 138.2529), "UK": (55.3781, -3.4360),
+    "Canada": (56.1304, -106.3468), "Australia": (-25.2744, 133.7751), "France": (46.2276, 2.2137), 
+    "China": (35.8617, 104.1954), "Mexico": (23.6345, -102.5528), "Unknown": (0,0)
+}
+COUNTRY_LAT = {country: lat for country, (lat, lon) in COUNTRY_COORDS.items()}
+COUNTRY_LON = {country: lon for country, (lat, lon) in COUNTRY_COORDS.items()}
+
 # --- Dummy Data Generation (Enhanced) ---
 @st.cache_data(ttl=3600) # Cache dummy data generation for an hour
 def generate_dummy_log_data(num_entries=50000): # Increased entries for better trends
@@ -127,149 +238,411 @@ def generate_dummy_log_data(num_entries=50000): # Increased entries for better t
     status_codes = [200] * 50 + [400] * 5 + [401] * 2 + [404] * 3 + [500] * 5 # More realistic distribution
     countries = ["USA", "Germany", "India", "Brazil", "Japan", "UK", "Canada", "Australia", "France", "China", "Mexico"]
 
-    log_entries = []
-    end_time = datetime.utcnow()
+    end_time = datetime.now(UTC)
     start_time = end_time - timedelta(days=90) # Generate 90 days of data
 
-    for _ in range(num_entries):
-        # Convert numpy types to standard Python types for MongoDB compatibility
-        api = str(np.random.choice(apis))
-        user_id = str(np.random.choice(users))
-        timestamp = start_time + (end_time - start_time) * np.random.rand()
-        status_code = int(np.random.choice(status_codes)) 
-        country = str(np.random.choice(countries))
-        
-        api_config = API_CONFIGS.get(api, {})
-        api_version = api_config.get("latest_version", "v1.0")
-        endpoint = str(np.random.choice(api_config.get("endpoints", ["/default"])))
-        
-        # Simulate latency for more realistic health data
-        base_latency = api_config.get("base_latency_ms", 50)
-        latency_variation = api_config.get("latency_variation", 20)
-        latency = float(max(10, base_latency + (np.random.rand() * 2 - 1) * latency_variation))
-
-        log_entries.append({
-            "api": api,
-            "timestamp": timestamp,
-            "user_id": user_id,
-            "status_code": status_code,
-            "country": country,
-            "api_version": api_version,
-            "endpoint": endpoint,
-            "latency_ms": latency
-        })
-    return log_entries
+    # Build every column as one NumPy array instead of 50k per-row dicts
+    rng = np.random.default_rng()
+    api_arr = rng.choice(apis, size=num_entries)
+    offsets = pd.to_timedelta(rng.random(num_entries) * (end_time - start_time).total_seconds(), unit="s")
+    timestamp_arr = pd.Timestamp(start_time) + offsets
+
+    api_series = pd.Series(api_arr)
+    version_arr = api_series.map({name: cfg.get("latest_version", "v1.0") for name, cfg in API_CONFIGS.items()}).to_numpy()
+    base_latency = api_series.map({name: cfg.get("base_latency_ms", 50) for name, cfg in API_CONFIGS.items()}).to_numpy(dtype=float)
+    latency_variation = api_series.map({name: cfg.get("latency_variation", 20) for name, cfg in API_CONFIGS.items()}).to_numpy(dtype=float)
+    # Simulate latency for more realistic health data
+    latency_arr = np.maximum(10, base_latency + (rng.random(num_entries) * 2 - 1) * latency_variation)
+
+    # Endpoints differ per API, so draw them one API (not one row) at a time
+    endpoint_arr = np.empty(num_entries, dtype=object)
+    for name, cfg in API_CONFIGS.items():
+        mask = api_arr == name
+        endpoint_arr[mask] = rng.choice(cfg.get("endpoints", ["/default"]), size=mask.sum())
+
+    df = pd.DataFrame({
+        "api": api_arr,
+        "timestamp": timestamp_arr,
+        "user_id": rng.choice(users, size=num_entries),
+        "status_code": rng.choice(status_codes, size=num_entries),
+        "country": rng.choice(countries, size=num_entries),
+        "api_version": version_arr,
+        "endpoint": endpoint_arr,
+        "latency_ms": latency_arr
+    })
+    # Records are only materialized here for insert_many; to_dict boxes values as plain Python types
+    return df.to_dict(orient="records")
 
-# Ensure some dummy data is in MongoDB if collections are empty
-if logs_collection.count_documents({}) == 0:
-    st.info("No logs found in MongoDB. Generating dummy data (this may take a moment)...")
-    dummy_logs = generate_dummy_log_data(50000)
-    logs_collection.insert_many(dummy_logs)
-    st.success("Dummy log data generated and inserted!")
-    st.cache_data.clear() # Clear cache to load new data
-    st.rerun()
+SEED_BATCH_SIZE = 10000
 
-if users_collection.count_documents({}) == 0:
-    st.info("No users found. Generating dummy users...")
-    dummy_users = [{"user_id": f"user_{i}", "email": f"user{i}@example.com", "role": "developer", "last_login": datetime.utcnow().isoformat()} for i in range(1, 21)]
-    users_collection.insert_many(dummy_users)
-    st.success("Dummy users generated!")
-    st.cache_data.clear()
-    st.rerun()
+# Ensure some dummy data is in MongoDB if collections are empty
+# Checked once per session with the O(1) metadata count rather than a count_documents scan per rerun
+if not st.session_state.get("seeded"):
+    if logs_collection.estimated_document_count() == 0:
+        st.info("No logs found in MongoDB. Generating dummy data (this may take a moment)...")
+        dummy_logs = generate_dummy_log_data(50000)
+        # Unordered 10k-document batches: the server can parallelise writes and one bad doc doesn't abort the rest
+        for batch_start in range(0, len(dummy_logs), SEED_BATCH_SIZE):
+            logs_collection.insert_many(dummy_logs[batch_start:batch_start + SEED_BATCH_SIZE], ordered=False, bypass_document_validation=True)
+        st.success("Dummy log data generated and inserted!")
+        st.cache_data.clear() # Clear cache to load new data
+        st.rerun()
+
+    if users_collection.estimated_document_count() == 0:
+        st.info("No users found. Generating dummy users...")
+        dummy_users = [{"user_id": f"user_{i}", "email": f"user{i}@example.com", "role": "developer", "last_login": datetime.now(UTC).isoformat()} for i in range(1, 21)]
+        users_collection.insert_many(dummy_users, ordered=False)
+        st.success("Dummy users generated!")
+        st.cache_data.clear()
+        st.rerun()
+
+    st.session_state["seeded"] = True
 
 # --- Helper Functions ---
-@st.cache_data(ttl=600) # Cache for 10 minutes
-def get_api_logs(start_date=None, end_date=None):
+def utc_day_bounds(start_date=None, end_date=None):
+    # Date-picker values -> tz-aware UTC datetimes covering whole days
+    window_start = datetime.combine(start_date, time.min, tzinfo=UTC) if start_date else None
+    window_end = datetime.combine(end_date, time.max, tzinfo=UTC) if end_date else None
+    return window_start, window_end
+
+def build_timestamp_query(start_date=None, end_date=None):
     query = {}
-    if start_date:
-        query["timestamp"] = {"$gte": datetime.combine(start_date, datetime.min.time())}
-    if end_date:
+    window_start, window_end = utc_day_bounds(start_date, end_date)
+    if window_start:
+        query["timestamp"] = {"$gte": window_start}
+    if window_end:
         if "timestamp" not in query:
             query["timestamp"] = {}
-        query["timestamp"]["$lte"] = datetime.combine(end_date, datetime.max.time())
-            
-    logs = list(logs_collection.find(query))
-    df = pd.DataFrame(logs)
-    if 'timestamp' in df.columns and not df.empty:
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        query["timestamp"]["$lte"] = window_end
+    return query
+
+# Fields the dashboard reads from each log, with the value used when a document lacks one
+LOG_FIELD_DEFAULTS = {
+    "api": "unknown_api", "timestamp": None, "user_id": "unknown_user", "status_code": 200,
+    "country": "Unknown", "api_version": "v1.0", "endpoint": "/default", "latency_ms": 50.0,
+}
+
+# Low-cardinality strings kept as categoricals: equality filters, groupbys and value_counts
+# compare small integer codes instead of walking Python str objects
+LOG_CATEGORY_COLUMNS = ["api", "user_id", "country", "api_version", "endpoint"]
+
+def fetch_api_logs(query, size_hint=1024):
+    # Only the columns the dashboard uses; _id and any extra fields never leave the server
+    log_projection = {"_id": 0, **{field: 1 for field in LOG_FIELD_DEFAULTS}}
+
+    # Stream the cursor straight into one array per column instead of a list of 50k dicts
+    # that pandas would then transpose; arrays double in size if the hint was too small
+    columns = {field: np.empty(size_hint, dtype=object) for field in LOG_FIELD_DEFAULTS}
+    n = 0
+    for doc in logs_collection.find(query, log_projection, batch_size=5000):
+        if n == size_hint:
+            columns = {field: np.concatenate([arr, np.empty(size_hint, dtype=object)]) for field, arr in columns.items()}
+            size_hint *= 2
+        # Defaults are written here, for missing and null fields alike, so there is no object-dtype fillna afterwards
+        for field, default in LOG_FIELD_DEFAULTS.items():
+            value = doc.get(field)
+            columns[field][n] = default if value is None else value
+        n += 1
+    df = pd.DataFrame({field: arr[:n] for field, arr in columns.items()}, copy=False)
+
+    df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
+    df["latency_ms"] = df["latency_ms"].astype(float) # Ensure float type
+
+    # Filter out "unknown_api" if it's just a placeholder and not real
+    df = df[df['api'] != 'unknown_api']
+    # Typed once, as rows enter the session cache; reruns then slice the typed frame as-is
+    df = df.astype({col: "category" for col in LOG_CATEGORY_COLUMNS})
+    return df.assign(status_code=df["status_code"].astype("int16"))
+
+def append_logs(df, new_rows):
+    # pd.concat falls back to object dtype when two categoricals' categories differ;
+    # union_categoricals merges them and keeps every column categorical
+    merged = pd.concat([df.drop(columns=LOG_CATEGORY_COLUMNS), new_rows.drop(columns=LOG_CATEGORY_COLUMNS)], ignore_index=True)
+    for col in LOG_CATEGORY_COLUMNS:
+        merged[col] = union_categoricals([df[col], new_rows[col]])
+    return merged[df.columns]
+
+def get_api_logs(start_date=None, end_date=None):
+    # Incremental per-session cache: after the first load only rows newer than the
+    # latest cached timestamp are fetched, so steady-state reruns cost O(new rows).
+    window_start, window_end = utc_day_bounds(start_date, end_date)
+    cache = st.session_state.get("logs_cache")
+
+    # Full reload only when the window starts before anything we have cached
+    if cache is None or (cache["start"] is not None and (window_start is None or window_start < cache["start"])):
+        # O(1) metadata count sizes the column arrays for the full load in one allocation
+        df = fetch_api_logs(build_timestamp_query(start_date, end_date), size_hint=max(logs_collection.estimated_document_count(), 1))
+        cache = {"start": window_start, "df": df}
     else:
-        # Fallback for empty/missing timestamp, ensures df has correct column types
+        delta_query = {"timestamp": {"$gt": cache["max_ts"]} if cache["max_ts"] is not None else {"$gte": cache["start"]}}
+        if window_end is not None:
+            delta_query["timestamp"]["$lte"] = window_end
+        new_rows = fetch_api_logs(delta_query)
+        if not new_rows.empty:
+            cache["df"] = append_logs(cache["df"], new_rows)
+            cache.pop("by_api", None) # The per-API split was built from the old frame
+    cache["max_ts"] = cache["df"]["timestamp"].max() if not cache["df"].empty else None
+    st.session_state["logs_cache"] = cache
+
+    df = cache["df"]
+    if window_start is not None:
+        df = df[df["timestamp"] >= window_start]
+    if window_end is not None:
+        df = df[df["timestamp"] <= window_end]
+    if df.empty:
         st.warning("Logs found but 'timestamp' column is missing or empty. Initializing with default.")
-        df['timestamp'] = pd.to_datetime([]) # Empty datetime series
-        
-    # Ensure all expected columns are present, adding defaults if necessary
-    expected_cols = ["api", "timestamp", "user_id", "status_code", "country", "api_version", "endpoint", "latency_ms"]
-    for col in expected_cols:
-        if col not in df.columns:
-            if col == 'api': df[col] = "unknown_api"
-            elif col == 'user_id': df[col] = "unknown_user"
-            elif col == 'status_code': df[col] = 200
-            elif col == 'country': df[col] = "Unknown"
-            elif col == 'api_version': df[col] = "v1.0"
-            elif col == 'endpoint': df[col] = "/default"
-            elif col == 'latency_ms': df[col] = 50.0 # Ensure float type
-            else: df[col] = None
-    
-    return df.copy() # Return a copy to prevent SettingWithCopyWarning
+    return df
+
+def get_logs_by_api(df_logs, start_date=None, end_date=None):
+    # One groupby per loaded frame and window: switching between API sections reuses the split
+    # instead of re-masking the full log frame. It lives in the logs_cache entry, so get_api_logs
+    # drops it whenever the cached frame is reloaded or extended.
+    cache = st.session_state["logs_cache"]
+    split = cache.get("by_api")
+    if split is None or split["window"] != (start_date, end_date):
+        # Row positions only, so the split doesn't hold a second copy of the logs
+        split = {"window": (start_date, end_date), "positions": df_logs.groupby("api", sort=False, observed=True).indices}
+        cache["by_api"] = split
+    return split["positions"]
+
+def cost_per_call_expr(api_path):
+    # COST_MAP inlined as a $switch so the pipeline needs no $lookup; unknown APIs cost 0
+    return {"$switch": {
+        "branches": [{"case": {"$eq": [api_path, name]}, "then": cost} for name, cost in COST_MAP.items()],
+        "default": 0,
+    }}
+
+# On-disk copy of the daily rollups so a restarted process doesn't start with a cold Mongo scan
+DISK_CACHE_DIR = ".cache"
+DISK_CACHE_TTL_SECONDS = 600 # Same lifetime as the in-memory st.cache_data entries
+
+def disk_cache_path(name, start_date, end_date):
+    return os.path.join(DISK_CACHE_DIR, f"{name}_{start_date}_{end_date}.parquet")
+
+def read_disk_cache(path):
+    try:
+        if time_module.time() - os.path.getmtime(path) < DISK_CACHE_TTL_SECONDS:
+            return pd.read_parquet(path)
+    except Exception: # Missing/expired file, or no parquet engine installed: fall through to MongoDB
+        pass
+    return None
+
+def write_disk_cache(df, path):
+    try:
+        os.makedirs(DISK_CACHE_DIR, exist_ok=True)
+        df.to_parquet(path, compression="zstd", index=False)
+    except Exception: # The disk cache is best-effort; never fail the page over it
+        pass
+
+def clear_disk_cache():
+    if os.path.isdir(DISK_CACHE_DIR):
+        for file_name in os.listdir(DISK_CACHE_DIR):
+            if file_name.endswith(".parquet"):
+                os.remove(os.path.join(DISK_CACHE_DIR, file_name))
+
+@st.cache_data(ttl=600) # Per (api, day) rollup computed inside MongoDB; only a few hundred rows cross the wire
+def get_api_daily_aggregates(start_date=None, end_date=None):
+    cache_path = disk_cache_path("daily", start_date, end_date)
+    cached = read_disk_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    pipeline = [
+        {"$match": build_timestamp_query(start_date, end_date)}, # First stage so the timestamp index can be used
+        {"$group": {
+            "_id": {"api": "$api", "day": {"$dateTrunc": {"date": "$timestamp", "unit": "day"}}},
+            "calls": {"$sum": 1},
+            "latency_sum": {"$sum": "$latency_ms"},
+            "errors": {"$sum": {"$cond": [{"$gte": ["$status_code", 400]}, 1, 0]}},
+        }},
+        {"$addFields": {"cost": {"$multiply": ["$calls", cost_per_call_expr("$_id.api")]}}},
+    ]
+    rows = [
+        {"api": doc["_id"].get("api"), "Date": doc["_id"].get("day"),
+         "calls": doc["calls"], "latency_sum": doc["latency_sum"], "errors": doc["errors"], "cost": doc["cost"]}
+        for doc in logs_collection.aggregate(pipeline, allowDiskUse=False)
+    ]
+    agg = pd.DataFrame(rows, columns=["api", "Date", "calls", "latency_sum", "errors", "cost"])
+    # Same filtering as get_api_logs: drop docs without an api name or timestamp
+    agg = agg[agg["api"].notna() & agg["Date"].notna() & (agg["api"] != "unknown_api")]
+    agg = agg.assign(Date=pd.to_datetime(agg["Date"], utc=True))
+    write_disk_cache(agg, cache_path)
+    return agg
+
+@st.cache_data(ttl=600) # Per-API calls and cost, summed from the daily rollup rather than a second pass over the logs
+def get_api_cost_summary(start_date=None, end_date=None):
+    agg = get_api_daily_aggregates(start_date=start_date, end_date=end_date)
+    summary = agg.groupby("api", sort=False)[["calls", "cost"]].sum().sort_values("calls", ascending=False)
+    return summary.reset_index().set_axis(["API", "Calls", "Cost ($)"], axis=1)
+
+@st.cache_data(ttl=600) # {value, count} rows for one log field, counted and sorted inside MongoDB
+def get_top_values(field, start_date=None, end_date=None, limit=None):
+    pipeline = [
+        {"$match": build_timestamp_query(start_date, end_date)},
+        {"$sortByCount": {"$ifNull": [f"${field}", LOG_FIELD_DEFAULTS[field]]}},
+    ]
+    if limit:
+        pipeline.append({"$limit": limit})
+    return pd.DataFrame([(doc["_id"], doc["count"]) for doc in logs_collection.aggregate(pipeline)],
+                        columns=[field, "count"])
+
+@st.cache_data(ttl=600) # Cached per (start, end) so widget clicks don't re-run the groupbys
+def get_overview_counts(start_date=None, end_date=None):
+    api_counts = get_api_cost_summary(start_date=start_date, end_date=end_date)
+    api_counts["Cost ($)"] = api_counts["Cost ($)"].round(3)
+    # Long-format view of the zero-filled (date x api) matrix, so days without calls plot as 0
+    df_daily_all = (get_daily_counts_matrix(start_date=start_date, end_date=end_date)
+                    .reset_index()
+                    .melt(id_vars="Date", var_name="api", value_name="Count")
+                    .rename(columns={"Date": "timestamp"}))
+    return api_counts, df_daily_all
+
+@st.cache_data(ttl=600) # One (date x api) count matrix per range, shared by every API tab
+def get_daily_counts_matrix(start_date=None, end_date=None):
+    agg = get_api_daily_aggregates(start_date=start_date, end_date=end_date)
+    if agg.empty:
+        daily = pd.DataFrame()
+    else:
+        daily = agg.pivot_table(index="Date", columns="api", values="calls", aggfunc="sum", fill_value=0)
 
-def calculate_daily_usage(df, api_name=None, start_date=None, end_date=None):
-    if df.empty:
-        end_date_default = end_date if end_date else datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        start_date_default = start_date if start_date else end_date_default - timedelta(days=29)
-        all_dates = pd.date_range(start=start_date_default, end=end_date_default, freq='D')
-        
-        dummy_counts = []
-        base_value = API_CONFIGS.get(api_name, {}).get("quota_daily", 1000) / 10 if api_name else 500
-        if base_value == 0: base_value = 100
-        
-        for day_idx in range(len(all_dates)):
-            trend_factor = np.sin(day_idx / 5) * (base_value / 2)
-            random_noise = np.random.normal(0, base_value / 4)
-            count = max(0, int(base_value + trend_factor + random_noise))
-            dummy_counts.append(count)
-            
-        return pd.DataFrame({"Date": all_dates, "Count": dummy_counts})
+    if start_date and end_date:
+        all_dates = pd.date_range(start=start_date, end=end_date, freq='D', tz=UTC)
+    elif not daily.empty:
+        all_dates = pd.date_range(start=daily.index.min(), end=daily.index.max(), freq='D')
+    else:
+        end_date_range = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+        all_dates = pd.date_range(start=end_date_range - timedelta(days=29), end=end_date_range, freq='D')
 
-    df_filtered = df
+    return daily.reindex(all_dates, fill_value=0).rename_axis("Date")
+
+@st.cache_data(ttl=600) # Takes only hashable args and pulls the cached matrix internally
+def calculate_daily_usage(api_name=None, start_date=None, end_date=None):
+    daily = get_daily_counts_matrix(start_date=start_date, end_date=end_date)
     if api_name:
-        df_filtered = df_filtered[df_filtered["api"] == api_name]
-    
-    df_daily = df_filtered.groupby(pd.Grouper(key="timestamp", freq="D")).size().reset_index(name="Count")
-    df_daily.columns = ["Date", "Count"]
+        series = daily[api_name] if api_name in daily.columns else pd.Series(0, index=daily.index)
+    else:
+        series = daily.sum(axis=1)
+
+    if series.sum() == 0:
+        return build_dummy_daily_usage(api_name, start_date, end_date, datetime.now(UTC).date().isoformat())
+
+    return series.reset_index(name="Count")
 
-    end_date_range = df_daily['Date'].max() if not df_daily.empty else datetime.utcnow()
-    start_date_range = df_daily['Date'].min() if not df_daily.empty else end_date_range - timedelta(days=29)
+def rng_for_day(day_key, salt=""):
+    # Seeded by the day (and an optional name) so synthetic data is identical for the whole day
+    return np.random.default_rng([int(day_key.replace("-", "")), zlib.crc32(salt.encode())])
+
+@st.cache_data(ttl=86400) # Keyed by day so the synthetic series stays stable across reruns
+def build_dummy_daily_usage(api_name, start_date, end_date, day_key):
+    end_date_default = end_date if end_date else datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    start_date_default = start_date if start_date else end_date_default - timedelta(days=29)
+    all_dates = pd.date_range(start=start_date_default, end=end_date_default, freq='D')
     
-    if start_date and end_date:
-        start_date_range = datetime.combine(start_date, datetime.min.time())
-        end_date_range = datetime.combine(end_date, datetime.max.time())
-        
-    all_dates = pd.date_range(start=start_date_range, end=end_date_range, freq='D')
-    full_df = pd.DataFrame(all_dates, columns=["Date"])
+    base_value = API_CONFIGS.get(api_name, {}).get("quota_daily", 1000) / 10 if api_name else 500
+    if base_value == 0: base_value = 100
     
-    daily_usage = pd.merge(full_df, df_daily, on="Date", how="left").fillna(0)
-    return daily_usage
+    day_idx = np.arange(len(all_dates))
+    trend_factor = np.sin(day_idx / 5) * (base_value / 2)
+    random_noise = rng_for_day(day_key, api_name or "").normal(0, base_value / 4, day_idx.size)
+    dummy_counts = np.clip(base_value + trend_factor + random_noise, 0, None).astype(int)
+        
+    return pd.DataFrame({"Date": all_dates, "Count": dummy_counts})
 
-def calculate_current_daily_usage(df, api_name):
-    if 'api' not in df.columns or df.empty:
-        return 0
+@st.cache_data(ttl=86400) # Keyed by day so the synthetic series stays stable across reruns
+def build_dummy_overview(day_key):
+    end_date = datetime.fromisoformat(day_key)
+    start_date = end_date - timedelta(days=29)
+    all_dates_dummy = pd.date_range(start=start_date, end=end_date, freq='D')
+    apis = list(API_CONFIGS.keys())
+    base_values = np.array([API_CONFIGS[api].get("quota_daily", 1000) / 10 for api in apis])
+    base_values[base_values == 0] = 100
+    date_idx = np.arange(len(all_dates_dummy))[:, None]
+    trend_factor = np.sin(date_idx / 4) * (base_values / 2)
+    random_noise = rng_for_day(day_key).normal(0, base_values / 4, (len(all_dates_dummy), len(apis)))
+    counts = np.clip(base_values + trend_factor + random_noise, 0, None).astype(int)
+    # Same melt as the real (date x api) matrix in get_overview_counts, so both feed one chart shape
+    return (pd.DataFrame(counts, index=all_dates_dummy.rename("timestamp"), columns=apis)
+            .reset_index()
+            .melt(id_vars="timestamp", var_name="api", value_name="Count"))
+
+@st.cache_data(ttl=60) # Today's calls for every API in one $group; only a handful of {api, count} rows come back
+def get_calls_today_by_api(today_start):
+    pipeline = [
+        {"$match": {"timestamp": {"$gte": today_start}}},
+        {"$group": {"_id": "$api", "calls": {"$sum": 1}}},
+    ]
+    return {doc["_id"]: doc["calls"] for doc in logs_collection.aggregate(pipeline)}
+
+def calculate_current_daily_usage(api_name, today_start):
+    # Switching between API pages reuses the same cached per-API counts
+    return get_calls_today_by_api(today_start).get(api_name, 0)
+
+def render_combined_chart(df_long):
+    # Shared by the real and dummy Overview branches; expects timestamp/api/Count long-format rows
+    fig_all_usage = _px().line(df_long, x="timestamp", y="Count", color="api", title="Daily API Usage (All APIs Combined)", template="plotly_white", render_mode="webgl")
+    fig_all_usage.update_layout(hovermode="x unified", legend_title_text='API', transition_duration=0)
+    st.plotly_chart(fig_all_usage, use_container_width=True)
+
+def count_categories(series):
+    # value_counts for a categorical column straight from its integer codes; only categories
+    # present in this slice are kept, most frequent first
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    order = np.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+    return tuple(series.cat.categories[order].astype(str)), tuple(counts[order].tolist())
+
+@st.cache_data(ttl=600) # Keyed on (api, window, row count); the leading underscore keeps the array itself unhashed
+def get_error_stats(tab_name, start_date, end_date, n_rows, _status_codes):
+    # One >= 400 mask per API slice, shared by the Error Breakdown and API Health views
+    error_mask = _status_codes >= 400
+    error_status, error_counts = np.unique(_status_codes[error_mask], return_counts=True)
+    error_rate_percent = float(error_mask.mean() * 100) if n_rows else 0.0
+    return tuple(error_status.tolist()), tuple(error_counts.tolist()), error_rate_percent
+
+# --- Cached figure builders ---
+# Inputs are small hashable tuples/scalars, so revisiting an unchanged view reuses the built figure
+@st.cache_data(ttl=600)
+def build_quota_trend_fig(tab_name, first_date, last_date, usage, quota_val):
+    # The daily index is rebuilt from its endpoints rather than passed in as a tuple of Timestamps
+    dates = pd.date_range(start=first_date, end=last_date, freq='D')
+    df_quota_trend = pd.DataFrame({"Date": dates, "Usage": usage, "Daily Quota": np.full(len(dates), quota_val)})
+    fig_quota_trend = _px().line(df_quota_trend, x="Date", y=["Usage", "Daily Quota"],
+                                title=f"Daily Usage vs. Quota for {tab_name}", template="plotly_white", render_mode="webgl")
+    fig_quota_trend.update_layout(hovermode="x unified", xaxis_title="Date", yaxis_title="Count", transition_duration=0)
+    return fig_quota_trend
 
-    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-    current_day_usage = df[(df["api"] == api_name) & (df["timestamp"] >= today_start)].shape[0]
-    return current_day_usage
+@st.cache_data(ttl=600)
+def build_error_pie_fig(title, status_codes, counts):
+    fig_errors = _px().pie(names=status_codes, values=counts, title=title,
+                        hole=0.4, color_discrete_sequence=_px().colors.sequential.RdBu)
+    fig_errors.update_traces(textinfo='percent+label', pull=[0.05]*len(counts))
+    return fig_errors
+
+@st.cache_data(ttl=600) # Takes pre-binned counts, so only 50 bars (not every sample) reach the browser
+def build_latency_hist_fig(tab_name, bin_counts, bin_edges):
+    edges = np.asarray(bin_edges)
+    fig_latency = go.Figure(go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=bin_counts, width=np.diff(edges) * 0.9, # 0.9: keeps the old bargap
+                                   marker_color=_px().colors.qualitative.Plotly[2]))
+    fig_latency.update_layout(title=f"Latency Distribution for {tab_name}", template="plotly_white",
+                              xaxis_title="Latency (ms)", yaxis_title="count")
+    return fig_latency
+
+@st.cache_data(ttl=600) # One go.Bar trace with per-bar colours, instead of px.bar's one trace per category
+def build_count_bar_fig(title, label, values, counts):
+    palette = _px().colors.qualitative.Plotly
+    fig = go.Figure(go.Bar(x=values, y=counts, marker_color=[palette[i % len(palette)] for i in range(len(values))]))
+    fig.update_layout(title=title, template="plotly_white", xaxis_title=label, yaxis_title="Calls")
+    return fig
 
 def get_api_health(api_name):
-    config = API_CONFIGS.get(api_name, {})
-    
-    base_latency = config.get("base_latency_ms", 50)
-    latency_variation = config.get("latency_variation", 20)
-    base_error_rate = config.get("base_error_rate_percent", 0.5)
-    error_rate_variation = config.get("error_rate_variation", 0.5)
+    base_latency, latency_variation, base_error_rate, error_rate_variation = HEALTH_PARAMS.get(api_name, DEFAULT_HEALTH_PARAMS)
 
-    latency_rand = base_latency + (np.random.rand() * 2 - 1) * latency_variation
+    # Scalar draws: random.random() avoids NumPy's per-call array machinery
+    latency_rand = base_latency + (random.random() * 2 - 1) * latency_variation
     latency_rand = max(10.0, latency_rand) # Ensure float type
 
-    error_rate_rand = base_error_rate + (np.random.rand() * 2 - 1) * error_rate_variation
+    error_rate_rand = base_error_rate + (random.random() * 2 - 1) * error_rate_variation
     error_rate_rand = max(0.01, error_rate_rand) 
 
     status = "healthy"
@@ -284,12 +657,16 @@ def get_api_health(api_name):
     
     return status, icon, round(latency_rand, 1), round(error_rate_rand, 2)
 
+@st.cache_data(ttl=60) # Keyed on the minute bucket so the simulated status holds steady between clicks
+def cached_health(api_name, minute_bucket):
+    return get_api_health(api_name)
+
 
 # --- API Key Management Functions ---
 def generate_api_key(user_id, api_name):
     key_id = str(uuid.uuid4())
     api_key_str = "sk-" + str(uuid.uuid4()).replace("-", "") # Example format
-    created_at = datetime.utcnow()
+    created_at = datetime.now(UTC)
     expires_at = created_at + timedelta(days=365) # Key valid for 1 year
     
     api_keys_collection.insert_one({
@@ -302,29 +679,169 @@ def generate_api_key(user_id, api_name):
         "status": "active"
     })
     st.success(f"New API Key generated for {user_id} for {api_name}: `{api_key_str}`")
-    st.cache_data.clear()
+    get_api_keys_by_user.clear() # Only the keys changed; log caches stay warm
     st.rerun()
 
 def update_api_key_status(key_id, status):
     api_keys_collection.update_one({"key_id": key_id}, {"$set": {"status": status}})
     st.success(f"API Key {key_id} status updated to {status}!")
-    st.cache_data.clear()
+    get_api_keys_by_user.clear()
     st.rerun()
 
+@st.cache_data(ttl=30) # All keys in one query, grouped by user; replaces one find() per user card
+def get_api_keys_by_user():
+    key_projection = {"_id": 0, "user_id": 1, "key_id": 1, "api_key": 1, "api": 1, "created_at": 1, "expires_at": 1, "status": 1}
+    all_keys = list(api_keys_collection.find({}, key_projection))
+    if all_keys:
+        # Parse every key's ISO dates in two vectorized calls (naive legacy strings are read as UTC)
+        created = pd.to_datetime([key["created_at"] for key in all_keys], utc=True, format="ISO8601")
+        expires = pd.to_datetime([key["expires_at"] for key in all_keys], utc=True, format="ISO8601")
+        for key, created_day, expires_day, expires_ns in zip(all_keys, created.strftime('%Y-%m-%d'), expires.strftime('%Y-%m-%d'),
+                                                             expires.tz_localize(None).to_numpy()):
+            key["created_day"], key["expires_day"], key["expires_ns"] = created_day, expires_day, expires_ns
+    keys_by_user = {}
+    for key in all_keys:
+        keys_by_user.setdefault(key.get("user_id"), []).append(key)
+    return keys_by_user
+
 # --- User Management (Simulated) ---
-@st.cache_data(ttl=600)
+@st.cache_data(ttl=30) # Cleared explicitly when a user is added
 def get_users():
-    return list(users_collection.find())
+    # Only the fields the user cards and selectors read
+    return list(users_collection.find({}, {"_id": 0, "user_id": 1, "email": 1, "role": 1, "last_login": 1}))
+
+
+# --- Support Tickets ---
+TICKET_PAGE_SIZE = 20 # Open tickets rendered (cards + close options) per page
+CLOSED_TICKET_LIMIT = 20 # Most recently closed tickets shown; also the cursor batch size, so one batch holds them all
+
+def open_ticket_card(ticket):
+    # User-supplied query/contact text is escaped so ticket text can't inject markup into the page
+    return f"""<div class="ticket-card" style="border-left: 8px solid {ticket['border_color']};">
+    <div class="ticket-header">
+        <span class="ticket-id">Ticket ID: <code>{ticket['_id']}</code></span>
+        <span class="ticket-aging">Aging: <strong>{ticket['hours_open']} hours</strong></span>
+    </div>
+    <p><strong>Query:</strong> {html.escape(ticket['query'])}</p>
+    <p><strong>Contact:</strong> {html.escape(ticket.get('contact', 'anonymous'))}</p>
+    <p><strong>Status:</strong> <span class="status-open">OPEN</span></p>
+</div>"""
+
+def closed_ticket_card(ticket):
+    return f"""<div class="ticket-card closed-ticket">
+    <div class="ticket-header">
+        <span class="ticket-id">Ticket ID: <code>{ticket['_id']}</code></span>
+        <span class="ticket-aging">Closed: <strong>{ticket['closed_display']}</strong></span>
+    </div>
+    <p><strong>Query:</strong> {html.escape(ticket['query'])}</p>
+    <p><strong>Contact:</strong> {html.escape(ticket.get('contact', 'anonymous'))}</p>
+    <p><strong>Status:</strong> <span class="status-closed">CLOSED</span></p>
+</div>"""
+
+@st.cache_data(ttl=30) # Cleared when tickets are closed here or the change stream reports a write
+def get_open_tickets():
+    # Aging, its border colour and the order are all computed server-side on native dates
+    return list(tickets_collection.aggregate([
+        {"$match": {"status": "open"}},
+        {"$sort": {"created_at": 1}},
+        {"$project": {
+            "_id": 1, "query": 1, "contact": 1,
+            # $convert is a no-op on dates; a string the migration could not parse reads as just opened
+            # instead of failing the whole aggregation
+            "hours_open": {"$round": [{"$divide": [{"$subtract": ["$$NOW", {
+                "$convert": {"input": "$created_at", "to": "date", "onError": "$$NOW", "onNull": "$$NOW"}
+            }]}, 3600000]}, 2]}
+        }},
+        {"$addFields": {"border_color": {"$switch": {
+            "branches": [
+                {"case": {"$gt": ["$hours_open", 72]}, "then": "#ef5350"},
+                {"case": {"$gt": ["$hours_open", 24]}, "then": "#ff8a65"}
+            ],
+            "default": "#7cb342"
+        }}}}
+    ]))
+
+@st.cache_data(ttl=30) # Cleared together with get_open_tickets: closing tickets changes this list too
+def get_closed_tickets():
+    # Display string formatted server-side; a ticket without closed_at shows the current time, as before
+    return list(tickets_collection.aggregate([
+        {"$match": {"status": "closed"}},
+        {"$sort": {"closed_at": -1}},
+        {"$limit": CLOSED_TICKET_LIMIT},
+        {"$project": {
+            "_id": 1, "query": 1, "contact": 1,
+            "closed_display": {"$dateToString": {"format": "%Y-%m-%d %H:%M", "date": {"$convert": {"input": "$closed_at", "to": "date", "onError": "$$NOW", "onNull": "$$NOW"}}}}
+        }}
+    ], batchSize=CLOSED_TICKET_LIMIT))
+
+
+# --- API Changelog ---
+@st.cache_resource(show_spinner=False) # The page script re-runs on every interaction; render the sections once per process
+def changelog_html():
+    # Static history; the literal lives in here so it, too, is built once per process rather than on every rerun
+    changelogs = {
+        "Image API": [
+            {"version": "v2.1", "date": "2025-06-15", "changes": "Improved image processing algorithm, reduced latency by 10%."},
+            {"version": "v2.0", "date": "2025-05-01", "changes": "Major update: New `/process` endpoint, deprecated `/old_process`. Improved stability."},
+            {"version": "v1.0", "date": "2024-11-20", "changes": "Initial release."}
+        ],
+        "Video API": [
+            {"version": "v1.5", "date": "2025-04-10", "changes": "Added support for MP4 format. Bug fixes for streaming."},
+            {"version": "v1.2", "date": "2025-02-01", "changes": "Enhanced metadata extraction."},
+            {"version": "v1.0", "date": "2024-12-05", "changes": "Initial release."}
+        ],
+        "Weather API": [
+            {"version": "v3.0", "date": "2025-06-01", "changes": "Migrated to new data source, improved accuracy. New historical data endpoint."},
+            {"version": "v2.1", "date": "2025-03-20", "changes": "Minor bug fixes and performance improvements."},
+            {"version": "v2.0", "date": "2024-10-10", "changes": "Major overhaul, new `forecast` endpoint introduced."},
+        ],
+        "Ecommerce API": [
+            {"version": "v2.3", "date": "2025-05-20", "changes": "Optimized product search API for faster results."},
+            {"version": "v2.2", "date": "2025-03-01", "changes": "Introduced new `/checkout` endpoint for streamlined purchases."},
+            {"version": "v2.0", "date": "2024-11-15", "changes": "Initial release of full e-commerce suite."}
+        ],
+        "QR Code API": [
+            {"version": "v1.2", "date": "2025-04-05", "changes": "Added support for various QR code types."},
+            {"version": "v1.0", "date": "2025-01-10", "changes": "Initial release."},
+        ],
+        "Profile Photo API": [
+            {"version": "v2.0", "date": "2025-05-10", "changes": "Improved image resizing and cropping features."},
+            {"version": "v1.0", "date": "2024-12-20", "changes": "Initial release."}
+        ],
+        "Jokes API": [
+            {"version": "v1.0", "date": "2025-02-14", "changes": "Initial release with various joke categories."}
+        ]
+    }
+    return {
+        api: f"<h3>{api} Changelog</h3>\n" + "\n".join(
+            f"""<div class="changelog-entry">
+    <div class="version-date">
+        <span class="version-tag">{entry['version']}</span>
+        <span class="change-date">{entry['date']}</span>
+    </div>
+    <p>{entry['changes']}</p>
+</div>"""
+            for entry in entries
+        ) + "\n<hr>" # Section separator folded in, so each API is a single st.markdown
+        for api, entries in changelogs.items()
+    }
 
 
 # --- Streamlit UI ---
 
 st.title("🚀 API Management Dashboard")
 
+now = datetime.now(UTC) # Read the clock once per render pass; everything below derives from it
+today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+if "_rng" not in st.session_state: # Checked first: setdefault would build (and OS-seed) a throwaway Generator every rerun
+    st.session_state["_rng"] = np.random.default_rng()
+rng = st.session_state["_rng"] # One Generator per session for the simulated UI values
+hours_passed_today = max((now - today_start).total_seconds() / 3600, 0.1) # Min 0.1 hours avoids dividing by ~zero just after midnight
+
 # --- Global Date Range Filter ---
 with st.sidebar:
     st.header("Global Filters")
-    today = datetime.utcnow().date()
+    today = now.date()
     default_start_date = today - timedelta(days=29) # Last 30 days
     
     date_range = st.date_input(
@@ -355,720 +872,622 @@ with st.sidebar:
         from streamlit_extras.rerun_with_delay import rerun_with_delay
         rerun_with_delay(delay_seconds=60)
 
+    if st.button("🔄 Refresh Data", key="refresh_data_btn"):
+        st.cache_data.clear()
+        clear_disk_cache()
+        st.session_state.pop("logs_cache", None) # Force a full reload, not just a delta
+        st.rerun()
+
 
 df_logs = get_api_logs(start_date=selected_start_date, end_date=selected_end_date)
-# Filter out "unknown_api" if it's just a placeholder and not real
-df_logs = df_logs[df_logs['api'] != 'unknown_api'] 
 
 
 st.markdown(" ")
 
-# --- Top-Level API Navigation (Horizontal Tabs) ---
-# Add new top-level tabs for Users and Admin
+# --- Top-Level API Navigation (Horizontal Radio) ---
+# Add new top-level sections for Users and Admin.
+# A radio (unlike st.tabs) lets us run only the selected section's branch on each rerun.
 api_tabs_list = ["Overview"] + sorted(list(API_CONFIGS.keys())) + ["Users", "Admin Tools", "Changelog"]
-selected_api_tab = st.tabs(api_tabs_list)
+tab_name = st.radio("Select a section:", api_tabs_list, horizontal=True, key="active_api", label_visibility="collapsed")
+
+if tab_name == "Overview":
+    st.subheader("Overall API Usage Summary")
+    
+    col1, col2, col3 = st.columns(3)
+    total_calls_overall = df_logs.shape[0]
+    total_cost_overall = get_api_cost_summary(start_date=selected_start_date, end_date=selected_end_date)["Cost ($)"].sum()
+
+    with col1:
+        st.metric(label="Total Calls (Selected Period)", value=f"{total_calls_overall:,}")
+    with col2:
+        st.metric(label="Total Estimated Cost (Selected Period)", value=f"${total_cost_overall:,.2f}")
+    with col3:
+        # Placeholder for average latency overall
+        avg_latency_overall = df_logs['latency_ms'].mean() if not df_logs.empty else 0
+        st.metric(label="Avg Latency (Selected Period)", value=f"{avg_latency_overall:.1f} ms")
+
+
+    if not df_logs.empty and 'api' in df_logs.columns and df_logs['api'].notna().any():
+        api_counts, df_daily_all = get_overview_counts(start_date=selected_start_date, end_date=selected_end_date)
+        st.dataframe(api_counts, use_container_width=True)
+
+        st.subheader("API Usage Over Time (All APIs Combined)")
+        
+        if df_daily_all.empty or df_daily_all['Count'].sum() == 0:
+            df_daily_all = build_dummy_overview(today.isoformat())
+        render_combined_chart(df_daily_all)
+    else:
+        dummy_rng = rng_for_day(today.isoformat(), "overview_counts")
+        dummy_api_counts = pd.DataFrame({
+            "API": list(API_CONFIGS.keys()),
+            "Calls": dummy_rng.integers(500, 5000, size=len(API_CONFIGS)),
+            "Cost ($)": np.round(dummy_rng.random(len(API_CONFIGS)) * 10, 2)
+        })
+        st.dataframe(dummy_api_counts, use_container_width=True)
+
+        st.subheader("API Usage Over Time (All APIs Combined)")
+        render_combined_chart(build_dummy_overview(today.isoformat()))
+
+    
+    # Feature: Top Users/Consumers (3)
+    st.subheader("Top API Consumers")
+    top_users = get_top_values("user_id", start_date=selected_start_date, end_date=selected_end_date, limit=10)
+    if not top_users.empty:
+        top_users.columns = ["User ID", "Total Calls"]
+        st.dataframe(top_users, use_container_width=True)
+    else:
+        st.info("No user data available to show top consumers.")
+
+    # Feature: Geographical Usage Map (6)
+    st.subheader("Geographical Usage Overview")
+    country_counts = get_top_values("country", start_date=selected_start_date, end_date=selected_end_date)
+    if len(country_counts) > 1:
+        country_counts.columns = ['Country', 'Calls']
+        country_counts["lat"] = country_counts["Country"].map(COUNTRY_LAT).fillna(0)
+        country_counts["lon"] = country_counts["Country"].map(COUNTRY_LON).fillna(0)
+
+        fig_geo = _px().scatter_geo(country_counts, locations="Country", locationmode='country names', 
+                                 size="Calls", hover_name="Country",
+                                 projection="natural earth", title="API Calls by Country",
+                                 color_discrete_sequence=_px().colors.qualitative.Plotly,
+                                 size_max=50) # Increase size_max for better visibility
+        fig_geo.update_layout(height=500, margin={"r":0,"t":50,"l":0,"b":0},
+                              paper_bgcolor="#1a1a1a", plot_bgcolor="#1a1a1a") # Dark grey map background
+        st.plotly_chart(fig_geo, use_container_width=True)
+    else:
+        st.info("Geographical data not available or insufficient for plotting.")
 
-for i, tab_name in enumerate(api_tabs_list):
-    with selected_api_tab[i]:
-        if tab_name == "Overview":
-            st.subheader("Overall API Usage Summary")
-            
-            col1, col2, col3 = st.columns(3)
-            total_calls_overall = df_logs.shape[0]
-            total_cost_overall = df_logs.apply(lambda row: API_CONFIGS.get(row["api"], {}).get("cost_per_call", 0), axis=1).sum()
-
-            with col1:
-                st.metric(label="Total Calls (Selected Period)", value=f"{total_calls_overall:,}")
-            with col2:
-                st.metric(label="Total Estimated Cost (Selected Period)", value=f"${total_cost_overall:,.2f}")
-            with col3:
-                # Placeholder for average latency overall
-                avg_latency_overall = df_logs['latency_ms'].mean() if not df_logs.empty else 0
-                st.metric(label="Avg Latency (Selected Period)", value=f"{avg_latency_overall:.1f} ms")
-
-
-            if not df_logs.empty and 'api' in df_logs.columns and df_logs['api'].any():
-                api_counts = df_logs["api"].value_counts().reset_index()
-                api_counts.columns = ["API", "Calls"]
-                api_counts["Cost ($)"] = api_counts.apply(
-                    lambda row: round(row["Calls"] * API_CONFIGS.get(row["API"], {}).get("cost_per_call", 0), 3), axis=1
-                )
-                st.dataframe(api_counts, use_container_width=True)
-
-                st.subheader("API Usage Over Time (All APIs Combined)")
-                df_daily_all = df_logs.groupby([pd.Grouper(key="timestamp", freq="D"), "api"]).size().reset_index(name="Count")
-                
-                if not df_daily_all.empty and df_daily_all['Count'].sum() > 0:
-                    fig_all_usage = px.line(df_daily_all, x="timestamp", y="Count", color="api", title="Daily API Usage (All APIs Combined)", template="plotly_white")
-                    fig_all_usage.update_layout(hovermode="x unified", legend_title_text='API')
-                    st.plotly_chart(fig_all_usage, use_container_width=True)
-                else:
-                    end_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-                    start_date = end_date - timedelta(days=29)
-                    all_dates_dummy = pd.date_range(start=start_date, end=end_date, freq='D')
-                    dummy_data_all = []
-                    for date_idx, date in enumerate(all_dates_dummy):
-                        for api in API_CONFIGS.keys():
-                            base_value = API_CONFIGS.get(api, {}).get("quota_daily", 1000) / 10 
-                            if base_value == 0: base_value = 100
-                            
-                            trend_factor = np.sin(date_idx / 4) * (base_value / 2)
-                            random_noise = np.random.normal(0, base_value / 4)
-                            count = max(0, int(base_value + trend_factor + random_noise))
-                            dummy_data_all.append({"timestamp": date, "api": api, "Count": count})
-                    df_dummy_all = pd.DataFrame(dummy_data_all)
-                    fig_all_usage = px.line(df_dummy_all, x="timestamp", y="Count", color="api", title="Daily API Usage (All APIs Combined)", template="plotly_white")
-                    fig_all_usage.update_layout(hovermode="x unified", legend_title_text='API')
-                    st.plotly_chart(fig_all_usage, use_container_width=True)
-            else:
-                dummy_api_counts = pd.DataFrame({
-                    "API": list(API_CONFIGS.keys()),
-                    "Calls": [np.random.randint(500, 5000) for _ in API_CONFIGS],
-                    "Cost ($)": [round(np.random.rand() * 10, 2) for _ in API_CONFIGS]
-                })
-                st.dataframe(dummy_api_counts, use_container_width=True)
-
-                st.subheader("API Usage Over Time (All APIs Combined)")
-                end_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-                start_date = end_date - timedelta(days=29)
-                all_dates_dummy = pd.date_range(start=start_date, end=end_date, freq='D')
-                dummy_data_all = []
-                for date_idx, date in enumerate(all_dates_dummy):
-                    for api in API_CONFIGS.keys():
-                        base_value = API_CONFIGS.get(api, {}).get("quota_daily", 1000) / 10 
-                        if base_value == 0: base_value = 100
-                        trend_factor = np.sin(date_idx / 4) * (base_value / 2)
-                        random_noise = np.random.normal(0, base_value / 4)
-                        count = max(0, int(base_value + trend_factor + random_noise))
-                        dummy_data_all.append({"timestamp": date, "api": api, "Count": count})
-                df_dummy_all = pd.DataFrame(dummy_data_all)
-                fig_all_usage = px.line(df_dummy_all, x="timestamp", y="Count", color="api", title="Daily API Usage (All APIs Combined)", template="plotly_white")
-                fig_all_usage.update_layout(hovermode="x unified", legend_title_text='API')
-                st.plotly_chart(fig_all_usage, use_container_width=True)
 
+    # Feature: Billing Period Cost Summary (14)
+    st.subheader("Current Billing Period Cost Summary")
+    st.info("Assuming a monthly billing cycle, starting on the 1st of each month.")
+    
+    first_day_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    # Boolean mask over the raw datetime64 array (UTC, tz dropped) instead of materialising a filtered frame
+    month_mask = df_logs["timestamp"].to_numpy(dtype="datetime64[ns]") >= np.datetime64(first_day_of_month.replace(tzinfo=None), "ns")
+    
+    current_month_cost = df_logs["api"].map(COST_MAP).to_numpy(dtype=float, na_value=0)[month_mask].sum()
+    current_month_calls = int(np.count_nonzero(month_mask))
+
+    col_curr_cost, col_proj_cost = st.columns(2)
+    with col_curr_cost:
+        st.metric(label="Calls This Month", value=f"{current_month_calls:,}")
+        st.metric(label="Cost This Month", value=f"${current_month_cost:,.2f}")
+    with col_proj_cost:
+        # Simple projection: current cost / days passed * days in month
+        days_in_month = (now.replace(day=1) + timedelta(days=32)).replace(day=1) - now.replace(day=1)
+        days_in_month = days_in_month.days
+        
+        days_passed = (now - first_day_of_month).days + 1
+        if days_passed == 0: days_passed = 1 # Avoid division by zero
+        
+        projected_month_cost = (current_month_cost / days_passed) * days_in_month
+        st.metric(label="Projected Cost This Month", value=f"${projected_month_cost:,.2f}")
+        st.markdown(f"<p>Based on usage over {days_passed} days. (Total {days_in_month} days in month)</p>", unsafe_allow_html=True)
+        
+        if projected_month_cost > 500: # Example threshold
+            st.warning("Projected monthly cost is high. Review your API usage patterns.")
+        else:
+            st.success("Projected monthly cost is well within limits.")
+
+elif tab_name in API_CONFIGS:
+    # Content for individual API tabs
+    st.header(f"📊 {tab_name} - Detailed Monitoring")
+    # Looked up once here; the metric branches below reuse these values
+    api_config = API_CONFIGS.get(tab_name, {})
+    quota_daily = api_config.get("quota_daily", "N/A")
+    rate_limit_per_second = api_config.get("rate_limit_per_second", "N/A")
+    cost_per_call = api_config.get("cost_per_call", "N/A")
+    documentation_url = api_config.get("documentation_url", "#")
+    latest_version = api_config.get("latest_version", "N/A")
+    endpoints = api_config.get("endpoints", [])
+
+    # Display key API info - ADDED CUSTOM CLASS `api-info-display-card`
+    st.markdown(f"""
+    <div class="api-info-display-card">
+        <div style="display: flex; justify-content: space-around; flex-wrap: wrap;">
+            <p style="margin: 5px 15px; font-size: 1.1em;"><strong>Version:</strong> {latest_version}</p>
+            <p style="margin: 5px 15px; font-size: 1.1em;"><strong>Daily Quota:</strong> {quota_daily:,} calls</p>
+            <p style="margin: 5px 15px; font-size: 1.1em;"><strong>Rate Limit:</strong> {rate_limit_per_second} req/sec</p>
+            <p style="margin: 5px 15px; font-size: 1.1em;"><strong>Cost/Call:</strong> ${cost_per_call}</p>
+        </div>
+        <div style="text-align: center; margin-top: 15px;">
+            <a href="{documentation_url}" target="_blank" class="button-link">🔗 View Documentation</a>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # --- Second-level navigation (horizontal radio; only the selected metric is built) ---
+    st.markdown("<h4>Select a metric:</h4>", unsafe_allow_html=True)
+    sub_options = ["Usage per API", "Quota per API", "Rate Limit per API", "Progress Bar", "API Health", 
+                   "Cost Projection", "Error Breakdown", "Latency Distribution", "API Version Metrics", "Endpoint Metrics"]
+    
+    # Radio rather than st.tabs: st.tabs executes every metric body (figures, queries) on each
+    # rerun and only hides them client-side; the radio renders just the selected metric
+    selected_option_label = st.radio("Select a metric:", sub_options, horizontal=True,
+                                     key=f"active_metric_{tab_name}", label_visibility="collapsed")
+
+    # Filter once per API rather than once per metric tab
+    api_positions = get_logs_by_api(df_logs, selected_start_date, selected_end_date).get(tab_name)
+    df_api_filtered = df_logs.iloc[api_positions] if api_positions is not None else df_logs.iloc[:0]
+
+    if selected_option_label == "Usage per API":
+        st.subheader(f"Daily API Usage Trend for {tab_name}")
+        
+        daily_usage_df = calculate_daily_usage(tab_name, start_date=selected_start_date, end_date=selected_end_date)
+        
+        total_calls = int(daily_usage_df['Count'].sum())
+
+        col_metric, col_graph = st.columns([1, 3])
+        with col_metric:
+            st.metric(label=f"Total Calls for {tab_name} (Selected Period)", value=f"{total_calls:,}")
+            st.markdown("<p>This graph shows the daily number of API calls over the selected period.</p>", unsafe_allow_html=True)
+            st.download_button(
+                label="Download Usage Data",
+                data=daily_usage_df.to_csv(index=False).encode('utf-8'),
+                file_name=f"{tab_name}_daily_usage.csv",
+                mime="text/csv",
+                key=f"download_usage_{tab_name}"
+            )
+        with col_graph:
+            fig_api_usage = _px().line(daily_usage_df, x="Date", y="Count",
+                                     title=f"Daily API Usage for {tab_name}", template="plotly_white", render_mode="webgl")
+            fig_api_usage.update_layout(hovermode="x unified", xaxis_title="Date", yaxis_title="Number of Calls", transition_duration=0)
+            st.plotly_chart(fig_api_usage, use_container_width=True)
+
+    elif selected_option_label == "Quota per API":
+        st.subheader(f"Quota Information and Trend for {tab_name}")
+        
+        quota_val = quota_daily
+
+        if quota_val > 0:
+            st.info(f"**Configured Daily Quota:** {quota_val:,} calls")
+            st.info(f"**Cost per Call:** ${cost_per_call}")
+
+            current_daily_usage = calculate_current_daily_usage(tab_name, today_start)
+            remaining_quota = quota_val - current_daily_usage
+
+            col_metric_quota, col_graph_quota = st.columns([1, 3])
+            with col_metric_quota:
+                st.metric(label="Current Daily Usage", value=f"{current_daily_usage:,} calls")
+                st.metric(label="Remaining Daily Quota", value=f"{remaining_quota:,} calls")
+                if remaining_quota <= 0:
+                    st.error("Daily quota exceeded! Consider increasing the limit or optimizing usage.")
+                elif remaining_quota < quota_val * 0.2:
+                    st.warning("Daily quota is running low! Only 20% or less remaining.")
+                else:
+                    st.success("Daily quota is well within limits.")
+            
+            with col_graph_quota:
+                daily_usage_for_quota = calculate_daily_usage(tab_name, start_date=selected_start_date, end_date=selected_end_date)
+                all_dates_for_plot = pd.date_range(start=daily_usage_for_quota['Date'].min(), end=daily_usage_for_quota['Date'].max(), freq='D')
+                # Zero-fill missing days with one reindex; the constant quota broadcasts as a scalar column
+                usage_series = daily_usage_for_quota.set_index('Date')['Count'].reindex(all_dates_for_plot, fill_value=0)
+                fig_quota_trend = build_quota_trend_fig(tab_name, all_dates_for_plot[0], all_dates_for_plot[-1], tuple(usage_series.tolist()), quota_val)
+                st.plotly_chart(fig_quota_trend, use_container_width=True)
+
+        else:
+            st.warning("Daily quota information is not configured or is zero for this API. Quota trend graph cannot be displayed.")
+            st.info("Please set a positive 'quota_daily' in the API_CONFIGS for this API.")
+
+
+    elif selected_option_label == "Rate Limit per API":
+        st.subheader(f"Rate Limit Information and Trend for {tab_name}")
+        if rate_limit_per_second != "N/A":
+            st.info(f"**Configured Rate Limit:** {rate_limit_per_second} calls per second")
+            st.markdown("""
+            <p>The rate limit dictates the maximum number of requests allowed within a one-second window to prevent system overload and ensure fair usage. Adhering to this limit is crucial for stable API performance.</p>
+            """, unsafe_allow_html=True)
             
-            # Feature: Top Users/Consumers (3)
-            st.subheader("Top API Consumers")
-            if not df_logs.empty and 'user_id' in df_logs.columns:
-                top_users = df_logs["user_id"].value_counts().reset_index()
-                top_users.columns = ["User ID", "Total Calls"]
-                st.dataframe(top_users.head(10), use_container_width=True)
+            end_date = today_start
+            start_date = end_date - timedelta(days=29)
+            
+            # The configured limit is constant, so draw it as a single shape rather than a per-day trace
+            fig_rate_limit_trend = go.Figure()
+            fig_rate_limit_trend.add_hline(y=rate_limit_per_second, line_color="#5b9bd5", line_width=3,
+                                           annotation_text=f"{rate_limit_per_second} req/sec")
+            fig_rate_limit_trend.update_xaxes(range=[start_date, end_date], type="date")
+            fig_rate_limit_trend.update_yaxes(range=[0, rate_limit_per_second * 1.5])
+            fig_rate_limit_trend.update_layout(title=f"Configured Daily Rate Limit for {tab_name}", template="plotly_white",
+                                               xaxis_title="Date", yaxis_title="Calls per Second")
+            st.plotly_chart(fig_rate_limit_trend, use_container_width=True)
+
+        else:
+            st.warning("Rate limit information is not configured for this API.")
+            st.info("No rate limit trend graph can be displayed without a configured rate limit.")
+
+    elif selected_option_label == "Progress Bar":
+        st.subheader(f"Daily Usage Progress for {tab_name}")
+
+        if quota_daily > 0:
+            actual_current_daily_usage = calculate_current_daily_usage(tab_name, today_start)
+
+            if actual_current_daily_usage > 0:
+                current_daily_usage = actual_current_daily_usage
+                st.info("Displaying real-time usage progress from actual logs.")
             else:
-                st.info("No user data available to show top consumers.")
+                current_daily_usage = int(rng.integers(0, quota_daily + 1))
+                st.info("No real-time usage data available for today. Displaying simulated progress.")
 
-            # Feature: Geographical Usage Map (6)
-            st.subheader("Geographical Usage Overview")
-            if not df_logs.empty and 'country' in df_logs.columns and df_logs['country'].nunique() > 1:
-                country_counts = df_logs['country'].value_counts().reset_index()
-                country_counts.columns = ['Country', 'Calls']
-                
-                # Simple dummy lat/long for countries for a basic map
-                country_coords = {
-                    "USA": (37.0902, -95.7129), "Germany": (51.1657, 10.4515), "India": (20.5937, 78.9629),
-                    "Brazil": (-14.2350, -51.9253), "Japan": (36.2048, 138.2529), "UK": (55.3781, -3.4360),
-                    "Canada": (56.1304, -106.3468), "Australia": (-25.2744, 133.7751), "France": (46.2276, 2.2137), 
-                    "China": (35.8617, 104.1954), "Mexico": (23.6345, -102.5528), "Unknown": (0,0)
-                }
-                country_counts['lat'] = country_counts['Country'].apply(lambda c: country_coords.get(c, (0,0))[0])
-                country_counts['lon'] = country_counts['Country'].apply(lambda c: country_coords.get(c, (0,0))[1])
-
-                fig_geo = px.scatter_geo(country_counts, locations="Country", locationmode='country names', 
-                                         size="Calls", hover_name="Country",
-                                         projection="natural earth", title="API Calls by Country",
-                                         color_discrete_sequence=px.colors.qualitative.Plotly,
-                                         size_max=50) # Increase size_max for better visibility
-                fig_geo.update_layout(height=500, margin={"r":0,"t":50,"l":0,"b":0},
-                                      paper_bgcolor="#1a1a1a", plot_bgcolor="#1a1a1a") # Dark grey map background
-                st.plotly_chart(fig_geo, use_container_width=True)
+            # One division: the ratio feeds st.progress directly, the percentage the thresholds
+            usage_ratio = min(current_daily_usage / quota_daily, 1.0)
+            progress_percentage = usage_ratio * 100
+
+            st.metric(label="Usage Today / Daily Quota", value=f"{current_daily_usage:,} / {quota_daily:,}")
+            st.progress(usage_ratio)
+
+            if progress_percentage >= 100:
+                st.error("Daily quota reached! No more calls can be made today without exceeding the limit.")
+            elif progress_percentage >= 80:
+                st.warning("Approaching daily quota limit! Usage is at 80% or more.")
             else:
-                st.info("Geographical data not available or insufficient for plotting.")
+                st.success("Daily usage is well within limits.")
+        else:
+            st.warning("Daily quota information is not configured or is zero for this API. Progress bar cannot be displayed.")
+            st.info("Please set a positive 'quota_daily' in the API_CONFIGS for this API.")
+
+    elif selected_option_label == "API Health":
+        st.subheader(f"Real-time Health Status for {tab_name}")
+        
+        status, icon, latency, error_rate = cached_health(tab_name, int(time_module.time() // 60))
+        _, _, observed_error_rate = get_error_stats(tab_name, selected_start_date, selected_end_date,
+                                                    len(df_api_filtered), df_api_filtered["status_code"].to_numpy())
+        
+        status_color = "green"
+        if status == "warning": status_color = "orange"
+        if status == "critical": status_color = "red"
+
+        st.markdown(f"""
+        <div class="api-health-card">
+            <div class="health-icon">
+                <span style="font-size: 3.5rem; animation: pulse-{status_color} 1.5s infinite alternate;">{icon}</span>
+            </div>
+            <div class="health-details">
+                <p style="font-size: 1.5rem; font-weight: bold; color: {status_color}; text-transform: uppercase;">Status: {status}</p>
+                <p>Average Latency: <strong>{latency} ms</strong></p>
+                <p>Error Rate: <strong>{error_rate}%</strong></p>
+                <p>Observed Error Rate (selected period): <strong>{observed_error_rate:.2f}%</strong></p>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        st.info("This section simulates the real-time health of the API based on latency and error rates. Values refresh once a minute.")
 
+    elif selected_option_label == "Cost Projection":
+        st.subheader(f"Projected Daily Cost for {tab_name}")
 
-            # Feature: Billing Period Cost Summary (14)
-            st.subheader("Current Billing Period Cost Summary")
-            st.info("Assuming a monthly billing cycle, starting on the 1st of each month.")
+        if cost_per_call > 0:
+            current_daily_usage = calculate_current_daily_usage(tab_name, today_start)
             
-            first_day_of_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            df_current_month = df_logs[df_logs["timestamp"] >= first_day_of_month]
+            projected_total_daily_calls = (current_daily_usage / hours_passed_today) * 24
+            projected_cost = projected_total_daily_calls * cost_per_call
+
+            col_proj_metric, col_proj_graph = st.columns([1, 3])
+            with col_proj_metric:
+                st.metric(label="Current Usage Today", value=f"{current_daily_usage:,} calls")
+                st.metric(label="Projected Total Calls Today", value=f"{int(projected_total_daily_calls):,}")
+                st.metric(label="Projected Daily Cost", value=f"${projected_cost:,.2f}")
+                if projected_cost > 100:
+                    st.warning("Projected daily cost is high! Monitor usage closely.")
             
-            current_month_cost = df_current_month.apply(lambda row: API_CONFIGS.get(row["api"], {}).get("cost_per_call", 0), axis=1).sum()
-            current_month_calls = df_current_month.shape[0]
-
-            col_curr_cost, col_proj_cost = st.columns(2)
-            with col_curr_cost:
-                st.metric(label="Calls This Month", value=f"{current_month_calls:,}")
-                st.metric(label="Cost This Month", value=f"${current_month_cost:,.2f}")
-            with col_proj_cost:
-                # Simple projection: current cost / days passed * days in month
-                days_in_month = (datetime.utcnow().replace(day=1) + timedelta(days=32)).replace(day=1) - datetime.utcnow().replace(day=1)
-                days_in_month = days_in_month.days
-                
-                days_passed = (datetime.utcnow() - first_day_of_month).days + 1
-                if days_passed == 0: days_passed = 1 # Avoid division by zero
-                
-                projected_month_cost = (current_month_cost / days_passed) * days_in_month
-                st.metric(label="Projected Cost This Month", value=f"${projected_month_cost:,.2f}")
-                st.markdown(f"<p>Based on usage over {days_passed} days. (Total {days_in_month} days in month)</p>", unsafe_allow_html=True)
-                
-                if projected_month_cost > 500: # Example threshold
-                    st.warning("Projected monthly cost is high. Review your API usage patterns.")
-                else:
-                    st.success("Projected monthly cost is well within limits.")
-
-        elif tab_name in API_CONFIGS:
-            # Content for individual API tabs
-            st.header(f"📊 {tab_name} - Detailed Monitoring")
-            api_config = API_CONFIGS.get(tab_name, {})
-            quota_daily = api_config.get("quota_daily", "N/A")
-            rate_limit_per_second = api_config.get("rate_limit_per_second", "N/A")
-            cost_per_call = api_config.get("cost_per_call", "N/A")
-            documentation_url = api_config.get("documentation_url", "#")
-            latest_version = api_config.get("latest_version", "N/A")
-            endpoints = api_config.get("endpoints", [])
-
-            # Display key API info - ADDED CUSTOM CLASS `api-info-display-card`
-            st.markdown(f"""
-            <div class="api-info-display-card">
-                <div style="display: flex; justify-content: space-around; flex-wrap: wrap;">
-                    <p style="margin: 5px 15px; font-size: 1.1em;"><strong>Version:</strong> {latest_version}</p>
-                    <p style="margin: 5px 15px; font-size: 1.1em;"><strong>Daily Quota:</strong> {quota_daily:,} calls</p>
-                    <p style="margin: 5px 15px; font-size: 1.1em;"><strong>Rate Limit:</strong> {rate_limit_per_second} req/sec</p>
-                    <p style="margin: 5px 15px; font-size: 1.1em;"><strong>Cost/Call:</strong> ${cost_per_call}</p>
-                </div>
-                <div style="text-align: center; margin-top: 15px;">
-                    <a href="{documentation_url}" target="_blank" class="button-link">🔗 View Documentation</a>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-
-            # --- Second-level navigation (Now using tabs for scrollability) ---
-            st.markdown("<h4>Select a metric:</h4>", unsafe_allow_html=True)
-            sub_options = ["Usage per API", "Quota per API", "Rate Limit per API", "Progress Bar", "API Health", 
-                           "Cost Projection", "Error Breakdown", "Latency Distribution", "API Version Metrics", "Endpoint Metrics"]
+            with col_proj_graph:
+                # Two scalar bars: a single go.Bar skips the DataFrame and px's per-category trace split
+                fig_cost_proj = go.Figure(go.Bar(
+                    x=["Current Cost", "Projected Additional Cost"],
+                    y=[current_daily_usage * cost_per_call, max(0, projected_total_daily_calls - current_daily_usage) * cost_per_call],
+                    marker_color=["#5b9bd5", "#ff8a65"]
+                ))
+                fig_cost_proj.update_layout(title=f"Cost Projection for {tab_name}", template="plotly_white",
+                                            showlegend=False, xaxis_title="", yaxis_title="Cost ($)",
+                                            hovermode="x unified")
+                st.plotly_chart(fig_cost_proj, use_container_width=True)
+
+        else:
+            st.warning("Cost per call is not configured for this API. Cost projection cannot be displayed.")
+
+    elif selected_option_label == "Error Breakdown": # Feature (4)
+        st.subheader(f"Error Status Code Breakdown for {tab_name}")
+        if not df_api_filtered.empty and 'status_code' in df_api_filtered.columns:
+            error_status, error_counts, _ = get_error_stats(tab_name, selected_start_date, selected_end_date,
+                                                            len(df_api_filtered), df_api_filtered["status_code"].to_numpy())
+            if error_status:
+                fig_errors = build_error_pie_fig(f"Error Status Codes for {tab_name}", error_status, error_counts)
+                st.plotly_chart(fig_errors, use_container_width=True)
+            else:
+                st.success(f"No error status codes (>=400) found for {tab_name} in the selected period. API is running perfectly!")
+                # Add some dummy error data if no errors are present in filtered logs
+                if rng.random() > 0.5: # 50% chance to show a dummy error if none exist
+                    dummy_error_data = pd.DataFrame({
+                        "Status Code": [400, 401, 500],
+                        "Count": rng.integers([5, 2, 1], [20, 10, 5])
+                    })
+                    fig_errors_dummy = _px().pie(dummy_error_data, names="Status Code", values="Count", 
+                                        title=f"Simulated Error Status Codes for {tab_name}",
+                                        hole=0.4, color_discrete_sequence=_px().colors.sequential.RdBu)
+                    fig_errors_dummy.update_traces(textinfo='percent+label', pull=[0.05]*len(dummy_error_data))
+                    st.plotly_chart(fig_errors_dummy, use_container_width=True)
+
+        else:
+            st.info(f"No data available to show error breakdown for {tab_name}.")
+
+    elif selected_option_label == "Latency Distribution": # Feature (5)
+        st.subheader(f"API Latency Distribution for {tab_name}")
+        if not df_api_filtered.empty and 'latency_ms' in df_api_filtered.columns:
+            latency_arr = df_api_filtered['latency_ms'].to_numpy(dtype=float)
+            latency_arr = latency_arr[np.isfinite(latency_arr)] # np.histogram can't auto-range over NaN
+            # Bin server-side: one NumPy pass instead of shipping every sample for Plotly to bin in the browser
+            bin_counts, bin_edges = np.histogram(latency_arr, bins=50)
+            fig_latency = build_latency_hist_fig(tab_name, tuple(bin_counts.tolist()), tuple(bin_edges.tolist()))
+            st.plotly_chart(fig_latency, use_container_width=True)
             
-            # Change from st.radio to st.tabs for horizontal scrolling
-            metric_tabs = st.tabs(sub_options)
-
-            # Iterate through the newly created tabs and render content based on selected tab
-            for metric_index, selected_option_label in enumerate(sub_options):
-                with metric_tabs[metric_index]: # Use 'with' context manager for each tab
-                    # The selected_option_label now acts as the condition for content rendering
-                    
-                    # st.markdown("---") # Add a separator below the tabs
-
-                    df_api_filtered = df_logs[df_logs["api"] == tab_name]
-
-                    if selected_option_label == "Usage per API":
-                        st.subheader(f"Daily API Usage Trend for {tab_name}")
-                        
-                        daily_usage_df = calculate_daily_usage(df_api_filtered, tab_name, start_date=selected_start_date, end_date=selected_end_date)
-                        
-                        total_calls = df_api_filtered.shape[0] if not df_api_filtered.empty else daily_usage_df['Count'].sum()
-
-                        col_metric, col_graph = st.columns([1, 3])
-                        with col_metric:
-                            st.metric(label=f"Total Calls for {tab_name} (Selected Period)", value=f"{total_calls:,}")
-                            st.markdown("<p>This graph shows the daily number of API calls over the selected period.</p>", unsafe_allow_html=True)
-                            st.download_button(
-                                label="Download Usage Data",
-                                data=daily_usage_df.to_csv(index=False).encode('utf-8'),
-                                file_name=f"{tab_name}_daily_usage.csv",
-                                mime="text/csv",
-                                key=f"download_usage_{tab_name}"
-                            )
-                        with col_graph:
-                            fig_api_usage = px.line(daily_usage_df, x="Date", y="Count",
-                                                     title=f"Daily API Usage for {tab_name}", template="plotly_white")
-                            fig_api_usage.update_layout(hovermode="x unified", xaxis_title="Date", yaxis_title="Number of Calls")
-                            st.plotly_chart(fig_api_usage, use_container_width=True)
-
-                    elif selected_option_label == "Quota per API":
-                        st.subheader(f"Quota Information and Trend for {tab_name}")
-                        
-                        quota_val = api_config.get("quota_daily", 0) 
-
-                        if quota_val > 0:
-                            st.info(f"**Configured Daily Quota:** {quota_val:,} calls")
-                            st.info(f"**Cost per Call:** ${cost_per_call}")
-
-                            current_daily_usage = calculate_current_daily_usage(df_api_filtered, tab_name)
-                            remaining_quota = quota_val - current_daily_usage
-
-                            col_metric_quota, col_graph_quota = st.columns([1, 3])
-                            with col_metric_quota:
-                                st.metric(label="Current Daily Usage", value=f"{current_daily_usage:,} calls")
-                                st.metric(label="Remaining Daily Quota", value=f"{remaining_quota:,} calls")
-                                if remaining_quota <= 0:
-                                    st.error("Daily quota exceeded! Consider increasing the limit or optimizing usage.")
-                                elif remaining_quota < quota_val * 0.2:
-                                    st.warning("Daily quota is running low! Only 20% or less remaining.")
+            st.markdown("<h4>Key Latency Percentiles:</h4>", unsafe_allow_html=True)
+            p50, p90, p99 = np.quantile(latency_arr, [0.5, 0.9, 0.99]) # One partition pass for all three
+            col_p50, col_p90, col_p99 = st.columns(3)
+            with col_p50: st.metric("50th Percentile (Median)", f"{p50:.1f} ms")
+            with col_p90: st.metric("90th Percentile", f"{p90:.1f} ms")
+            with col_p99: st.metric("99th Percentile", f"{p99:.1f} ms")
+        else:
+            st.info(f"No latency data available for {tab_name}.")
+
+    elif selected_option_label == "API Version Metrics": # Feature (7)
+        st.subheader(f"API Version Usage for {tab_name}")
+        if not df_api_filtered.empty and 'api_version' in df_api_filtered.columns:
+            version_labels, version_calls = count_categories(df_api_filtered["api_version"])
+            fig_versions = build_count_bar_fig(f"Usage by API Version for {tab_name}", "API Version", version_labels, version_calls)
+            st.plotly_chart(fig_versions, use_container_width=True)
+            st.markdown(f"<p>Latest Version: <strong>{latest_version}</strong></p>", unsafe_allow_html=True)
+        else:
+            st.info(f"No API version data available for {tab_name}.")
+
+    elif selected_option_label == "Endpoint Metrics": # Feature (13)
+        st.subheader(f"Endpoint Usage for {tab_name}")
+        if not df_api_filtered.empty and 'endpoint' in df_api_filtered.columns:
+            endpoint_labels, endpoint_calls = count_categories(df_api_filtered["endpoint"])
+            fig_endpoints = build_count_bar_fig(f"Usage by Endpoint for {tab_name}", "Endpoint", endpoint_labels, endpoint_calls)
+            st.plotly_chart(fig_endpoints, use_container_width=True)
+        else:
+            st.info(f"No endpoint data available for {tab_name}.")
+
+
+elif tab_name == "Users": # Feature: User Profile/Management (1, 2)
+    st.header("👤 User Management")
+
+    user_tabs = st.tabs(["User List & API Keys", "Add New User"])
+
+    with user_tabs[0]:
+        st.markdown("<h3>Registered Users and Their API Keys</h3>", unsafe_allow_html=True)
+        users_data = get_users()
+        keys_by_user = get_api_keys_by_user()
+        if users_data:
+            # Mutation widgets (expanders, buttons) are only registered for admins; other roles get the read-only view
+            is_admin = current_user_role == "Admin"
+            if is_admin:
+                # Expiry cut-offs as naive-UTC datetime64, compared against each user's key array in one pass
+                now_np = np.datetime64(now.replace(tzinfo=None), "ns")
+                now_plus_30_np = np.datetime64((now + timedelta(days=30)).replace(tzinfo=None), "ns")
+
+            # Every user card goes out in one st.markdown; each user's key grid and admin controls follow
+            # in a per-user expander below, so the markdown count no longer grows with the user list
+            user_cards = []
+            for user in users_data:
+                key_count = len(keys_by_user.get(user['user_id'], []))
+                key_note = (f"<p>Associated API Keys: <strong>{key_count}</strong></p>" if key_count
+                            else f"<p>No API keys found for {user['user_id']}.</p>")
+                # Dedented per card: st.markdown only strips indentation common to the whole string,
+                # and an indented card would render as a code block
+                user_cards.append(textwrap.dedent(f"""
+                <div class="user-card">
+                    <div class="user-header">
+                        <h4>{user['user_id']} ({user.get('email', 'N/A')})</h4>
+                        <span class="user-role">{user.get('role', 'N/A').upper()}</span>
+                    </div>
+                    <p>Last Login: <strong>{datetime.fromisoformat(user['last_login']).strftime('%Y-%m-%d %H:%M')}</strong></p>
+                    {key_note}
+                </div>
+                """))
+            st.markdown("\n".join(user_cards), unsafe_allow_html=True)
+
+            st.markdown("<h4>API Keys by User</h4>", unsafe_allow_html=True)
+            for user in users_data:
+                user_api_keys = keys_by_user.get(user['user_id'], [])
+                if not user_api_keys and not is_admin:
+                    continue # Nothing to show beyond the card's "no keys" note
+                with st.expander(f"API Keys for {user['user_id']}" if user_api_keys else f"Generate a Key for {user['user_id']}"):
+                    if user_api_keys:
+                        # Native grid instead of server-rendered to_html(); status colour comes from a Styler
+                        df_keys = pd.DataFrame({
+                            "Key ID": [key['key_id'] for key in user_api_keys],
+                            "API Key (partial)": [f"{key['api_key'][:8]}..." for key in user_api_keys],
+                            "API": [key['api'] for key in user_api_keys],
+                            "Created At": [key['created_day'] for key in user_api_keys],
+                            "Expires At": [key['expires_day'] for key in user_api_keys],
+                            "Status": [key['status'].upper() for key in user_api_keys],
+                        })
+                        st.dataframe(
+                            df_keys.style.map(lambda v: "color: green; font-weight: bold" if v == "ACTIVE" else "color: red; font-weight: bold", subset=["Status"]),
+                            hide_index=True, use_container_width=True,
+                            column_config={"Status": st.column_config.TextColumn()}
+                        )
+
+                    if not is_admin:
+                        continue
+
+                    if user_api_keys:
+                        # Actions on keys (if Admin)
+                        expires_arr = np.array([key['expires_ns'] for key in user_api_keys], dtype="datetime64[ns]")
+                        active_arr = np.array([key['status'] == 'active' for key in user_api_keys])
+                        expiring_soon = active_arr & (expires_arr < now_plus_30_np)
+                        expired = active_arr & (expires_arr < now_np)
+                        for key_index, key in enumerate(user_api_keys):
+                            col_key_id, col_status_btn = st.columns([3, 1])
+                            with col_key_id:
+                                st.write(f"Key `{key['api_key'][:8]}...` for {key['api']} (Status: {key['status']})")
+                            with col_status_btn:
+                                if key['status'] == 'active':
+                                    if st.button("🔴 Deactivate", key=f"deactivate_{key['key_id']}"):
+                                        update_api_key_status(key['key_id'], "inactive")
                                 else:
-                                    st.success("Daily quota is well within limits.")
-                            
-                            with col_graph_quota:
-                                daily_usage_for_quota = calculate_daily_usage(df_api_filtered, tab_name, start_date=selected_start_date, end_date=selected_end_date)
-                                daily_usage_dict = daily_usage_for_quota.set_index('Date')['Count'].to_dict()
-
-                                all_dates_for_plot = pd.date_range(start=daily_usage_for_quota['Date'].min(), end=daily_usage_for_quota['Date'].max(), freq='D')
-                                quota_trend_data = []
-                                for date in all_dates_for_plot:
-                                    usage = daily_usage_dict.get(date, 0)
-                                    quota_trend_data.append({"Date": date, "Usage": usage, "Daily Quota": quota_val})
-
-                                df_quota_trend = pd.DataFrame(quota_trend_data)
-                                
-                                fig_quota_trend = px.line(df_quota_trend, x="Date", y=["Usage", "Daily Quota"],
-                                                            title=f"Daily Usage vs. Quota for {tab_name}", template="plotly_white")
-                                fig_quota_trend.update_layout(hovermode="x unified", xaxis_title="Date", yaxis_title="Count")
-                                st.plotly_chart(fig_quota_trend, use_container_width=True)
+                                    if st.button("🟢 Activate", key=f"activate_{key['key_id']}"):
+                                        update_api_key_status(key['key_id'], "active")
+                                # Feature: API Key Rotation Reminders (2.4)
+                                if expiring_soon[key_index]:
+                                    st.warning(f"Key expires soon ({key['expires_day']})! Consider rotation.")
+                                elif expired[key_index]:
+                                    st.error("Key has expired! Please deactivate or rotate.")
+                    else:
+                        if st.button(f"Generate New Key for {user['user_id']}", key=f"gen_key_{user['user_id']}"):
+                            api_for_new_key = st.selectbox(f"Select API for new key for {user['user_id']}", list(API_CONFIGS.keys()))
+                            generate_api_key(user['user_id'], api_for_new_key)
+        else:
+            st.info("No registered users found. Add some dummy users if this is unexpected.")
+            if st.button("Generate Dummy Users (Admin Only)"):
+                st.warning("Switch to Admin role in sidebar to generate users.") # Remind user about role
+
+
+    with user_tabs[1]:
+        st.markdown("<h3>Create a New User Account</h3>", unsafe_allow_html=True)
+        if current_user_role == "Admin":
+            with st.form("new_user_form"):
+                new_user_id = st.text_input("New User ID (e.g., username)", key="new_user_id_input")
+                new_user_email = st.text_input("User Email", key="new_user_email_input")
+                new_user_role = st.selectbox("User Role", ["developer", "admin", "viewer"], key="new_user_role_select")
+                submitted = st.form_submit_button("Add User")
+                if submitted:
+                    if new_user_id and new_user_email:
+                        users_collection.insert_one({
+                            "user_id": new_user_id,
+                            "email": new_user_email,
+                            "role": new_user_role,
+                            "last_login": datetime.now(UTC).isoformat(),
+                            "created_at": datetime.now(UTC).isoformat()
+                        })
+                        st.success(f"User {new_user_id} added successfully!")
+                        get_users.clear()
+                        st.rerun()
+                    else:
+                        st.error("User ID and Email are required.")
+        else:
+            st.warning("You need 'Admin' role to add new users.")
 
-                        else:
-                            st.warning("Daily quota information is not configured or is zero for this API. Quota trend graph cannot be displayed.")
-                            st.info("Please set a positive 'quota_daily' in the API_CONFIGS for this API.")
-
-
-                    elif selected_option_label == "Rate Limit per API":
-                        st.subheader(f"Rate Limit Information and Trend for {tab_name}")
-                        if rate_limit_per_second != "N/A":
-                            st.info(f"**Configured Rate Limit:** {rate_limit_per_second} calls per second")
-                            st.markdown("""
-                            <p>The rate limit dictates the maximum number of requests allowed within a one-second window to prevent system overload and ensure fair usage. Adhering to this limit is crucial for stable API performance.</p>
-                            """, unsafe_allow_html=True)
-                            
-                            end_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-                            start_date = end_date - timedelta(days=29)
-                            all_dates = pd.date_range(start=start_date, end=end_date, freq='D')
-                            
-                            rate_limit_trend_data = []
-                            for date in all_dates:
-                                rate_limit_trend_data.append({"Date": date, "Rate Limit": rate_limit_per_second})
-                            
-                            df_rate_limit_trend = pd.DataFrame(rate_limit_trend_data)
-                            
-                            fig_rate_limit_trend = px.line(df_rate_limit_trend, x="Date", y="Rate Limit",
-                                                            title=f"Configured Daily Rate Limit for {tab_name}", template="plotly_white")
-                            fig_rate_limit_trend.update_layout(hovermode="x unified", xaxis_title="Date", yaxis_title="Calls per Second")
-                            st.plotly_chart(fig_rate_limit_trend, use_container_width=True)
 
-                        else:
-                            st.warning("Rate limit information is not configured for this API.")
-                            st.info("No rate limit trend graph can be displayed without a configured rate limit.")
-
-                    elif selected_option_label == "Progress Bar":
-                        st.subheader(f"Daily Usage Progress for {tab_name}")
-                        
-                        api_config = API_CONFIGS.get(tab_name, {})
-                        quota_daily = api_config.get("quota_daily", 0)
-
-                        if quota_daily > 0:
-                            today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-                            actual_current_daily_usage = 0
-                            if not df_api_filtered.empty and 'api' in df_api_filtered.columns:
-                                actual_current_daily_usage = df_api_filtered[(df_api_filtered["timestamp"] >= today_start)].shape[0]
-
-                            if actual_current_daily_usage > 0:
-                                current_daily_usage = actual_current_daily_usage
-                                st.info("Displaying real-time usage progress from actual logs.")
-                            else:
-                                current_daily_usage = np.random.randint(0, quota_daily + 1)
-                                st.info("No real-time usage data available for today. Displaying simulated progress.")
-
-                            progress_percentage = min((current_daily_usage / quota_daily) * 100, 100)
-
-                            st.metric(label="Usage Today / Daily Quota", value=f"{current_daily_usage:,} / {quota_daily:,}")
-                            st.progress(progress_percentage / 100)
-
-                            if progress_percentage >= 100:
-                                st.error("Daily quota reached! No more calls can be made today without exceeding the limit.")
-                            elif progress_percentage >= 80:
-                                st.warning("Approaching daily quota limit! Usage is at 80% or more.")
-                            else:
-                                st.success("Daily usage is well within limits.")
-                        else:
-                            st.warning("Daily quota information is not configured or is zero for this API. Progress bar cannot be displayed.")
-                            st.info("Please set a positive 'quota_daily' in the API_CONFIGS for this API.")
-
-                    elif selected_option_label == "API Health":
-                        st.subheader(f"Real-time Health Status for {tab_name}")
-                        
-                        status, icon, latency, error_rate = get_api_health(tab_name)
-                        
-                        status_color = "green"
-                        if status == "warning": status_color = "orange"
-                        if status == "critical": status_color = "red"
-
-                        st.markdown(f"""
-                        <div class="api-health-card">
-                            <div class="health-icon">
-                                <span style="font-size: 3.5rem; animation: pulse-{status_color} 1.5s infinite alternate;">{icon}</span>
-                            </div>
-                            <div class="health-details">
-                                <p style="font-size: 1.5rem; font-weight: bold; color: {status_color}; text-transform: uppercase;">Status: {status}</p>
-                                <p>Average Latency: <strong>{latency} ms</strong></p>
-                                <p>Error Rate: <strong>{error_rate}%</strong></p>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        st.info("This section simulates the real-time health of the API based on latency and error rates. Values change on each interaction.")
-
-                    elif selected_option_label == "Cost Projection":
-                        st.subheader(f"Projected Daily Cost for {tab_name}")
-
-                        api_config = API_CONFIGS.get(tab_name, {})
-                        cost_per_call = api_config.get("cost_per_call", 0)
-                        
-                        if cost_per_call > 0:
-                            current_daily_usage = calculate_current_daily_usage(df_api_filtered, tab_name)
-                            
-                            hours_passed = (datetime.utcnow() - datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)).total_seconds() / 3600
-                            if hours_passed == 0: hours_passed = 0.1 # Avoid division by zero, min 0.1 hours
-                            
-                            projected_total_daily_calls = (current_daily_usage / hours_passed) * 24
-                            projected_cost = projected_total_daily_calls * cost_per_call
-
-                            col_proj_metric, col_proj_graph = st.columns([1, 3])
-                            with col_proj_metric:
-                                st.metric(label="Current Usage Today", value=f"{current_daily_usage:,} calls")
-                                st.metric(label="Projected Total Calls Today", value=f"{int(projected_total_daily_calls):,}")
-                                st.metric(label="Projected Daily Cost", value=f"${projected_cost:,.2f}")
-                                if projected_cost > 100:
-                                    st.warning("Projected daily cost is high! Monitor usage closely.")
-                            
-                            with col_proj_graph:
-                                cost_data = pd.DataFrame({
-                                    "Category": ["Current Cost", "Projected Additional Cost"],
-                                    "Cost": [current_daily_usage * cost_per_call, (projected_total_daily_calls - current_daily_usage) * cost_per_call]
-                                })
-                                fig_cost_proj = px.bar(cost_data, x="Category", y="Cost", 
-                                                        title=f"Cost Projection for {tab_name}",
-                                                        color="Category",
-                                                        color_discrete_map={"Current Cost": "#5b9bd5", "Projected Additional Cost": "#ff8a65"},
-                                                        template="plotly_white")
-                                fig_cost_proj.update_layout(showlegend=False, xaxis_title="", yaxis_title="Cost ($)",
-                                                            hovermode="x unified")
-                                st.plotly_chart(fig_cost_proj, use_container_width=True)
+elif tab_name == "Admin Tools":
+    st.header("⚙️ Admin Configuration & Tools")
 
-                        else:
-                            st.warning("Cost per call is not configured for this API. Cost projection cannot be displayed.")
-
-                    elif selected_option_label == "Error Breakdown": # Feature (4)
-                        st.subheader(f"Error Status Code Breakdown for {tab_name}")
-                        if not df_api_filtered.empty and 'status_code' in df_api_filtered.columns:
-                            error_codes = df_api_filtered[df_api_filtered["status_code"] >= 400]
-                            if not error_codes.empty:
-                                error_counts = error_codes["status_code"].value_counts().reset_index()
-                                error_counts.columns = ["Status Code", "Count"]
-                                fig_errors = px.pie(error_counts, names="Status Code", values="Count", 
-                                                    title=f"Error Status Codes for {tab_name}",
-                                                    hole=0.4,
-                                                    color_discrete_sequence=px.colors.sequential.RdBu)
-                                fig_errors.update_traces(textinfo='percent+label', pull=[0.05]*len(error_counts))
-                                st.plotly_chart(fig_errors, use_container_width=True)
-                            else:
-                                st.success(f"No error status codes (>=400) found for {tab_name} in the selected period. API is running perfectly!")
-                                # Add some dummy error data if no errors are present in filtered logs
-                                if np.random.rand() > 0.5: # 50% chance to show a dummy error if none exist
-                                    dummy_error_data = pd.DataFrame({
-                                        "Status Code": [400, 401, 500],
-                                        "Count": [np.random.randint(5, 20), np.random.randint(2, 10), np.random.randint(1, 5)]
-                                    })
-                                    fig_errors_dummy = px.pie(dummy_error_data, names="Status Code", values="Count", 
-                                                        title=f"Simulated Error Status Codes for {tab_name}",
-                                                        hole=0.4, color_discrete_sequence=px.colors.sequential.RdBu)
-                                    fig_errors_dummy.update_traces(textinfo='percent+label', pull=[0.05]*len(dummy_error_data))
-                                    st.plotly_chart(fig_errors_dummy, use_container_width=True)
-
-                        else:
-                            st.info(f"No data available to show error breakdown for {tab_name}.")
-
-                    elif selected_option_label == "Latency Distribution": # Feature (5)
-                        st.subheader(f"API Latency Distribution for {tab_name}")
-                        if not df_api_filtered.empty and 'latency_ms' in df_api_filtered.columns:
-                            fig_latency = px.histogram(df_api_filtered, x="latency_ms", nbins=50, 
-                                                    title=f"Latency Distribution for {tab_name}",
-                                                    labels={"latency_ms": "Latency (ms)"},
-                                                    template="plotly_white",
-                                                    color_discrete_sequence=[px.colors.qualitative.Plotly[2]])
-                            fig_latency.update_layout(bargap=0.1)
-                            st.plotly_chart(fig_latency, use_container_width=True)
-                            
-                            st.markdown("<h4>Key Latency Percentiles:</h4>", unsafe_allow_html=True)
-                            p50 = df_api_filtered['latency_ms'].quantile(0.5)
-                            p90 = df_api_filtered['latency_ms'].quantile(0.9)
-                            p99 = df_api_filtered['latency_ms'].quantile(0.99)
-                            col_p50, col_p90, col_p99 = st.columns(3)
-                            with col_p50: st.metric("50th Percentile (Median)", f"{p50:.1f} ms")
-                            with col_p90: st.metric("90th Percentile", f"{p90:.1f} ms")
-                            with col_p99: st.metric("99th Percentile", f"{p99:.1f} ms")
-                        else:
-                            st.info(f"No latency data available for {tab_name}.")
-
-                    elif selected_option_label == "API Version Metrics": # Feature (7)
-                        st.subheader(f"API Version Usage for {tab_name}")
-                        if not df_api_filtered.empty and 'api_version' in df_api_filtered.columns:
-                            version_counts = df_api_filtered["api_version"].value_counts().reset_index()
-                            version_counts.columns = ["API Version", "Calls"]
-                            fig_versions = px.bar(version_counts, x="API Version", y="Calls", 
-                                                title=f"Usage by API Version for {tab_name}",
-                                                color="API Version",
-                                                template="plotly_white")
-                            st.plotly_chart(fig_versions, use_container_width=True)
-                            st.markdown(f"<p>Latest Version: <strong>{latest_version}</strong></p>", unsafe_allow_html=True)
-                        else:
-                            st.info(f"No API version data available for {tab_name}.")
-
-                    elif selected_option_label == "Endpoint Metrics": # Feature (13)
-                        st.subheader(f"Endpoint Usage for {tab_name}")
-                        if not df_api_filtered.empty and 'endpoint' in df_api_filtered.columns:
-                            endpoint_counts = df_api_filtered["endpoint"].value_counts().reset_index()
-                            endpoint_counts.columns = ["Endpoint", "Calls"]
-                            fig_endpoints = px.bar(endpoint_counts, x="Endpoint", y="Calls", 
-                                                title=f"Usage by Endpoint for {tab_name}",
-                                                color="Endpoint",
-                                                template="plotly_white")
-                            st.plotly_chart(fig_endpoints, use_container_width=True)
-                        else:
-                            st.info(f"No endpoint data available for {tab_name}.")
-
-
-        elif tab_name == "Users": # Feature: User Profile/Management (1, 2)
-            st.header("👤 User Management")
-
-            user_tabs = st.tabs(["User List & API Keys", "Add New User"])
-
-            with user_tabs[0]:
-                st.markdown("<h3>Registered Users and Their API Keys</h3>", unsafe_allow_html=True)
-                users_data = get_users()
-                if users_data:
-                    for user in users_data:
-                        st.markdown(f"""
-                        <div class="user-card">
-                            <div class="user-header">
-                                <h4>{user['user_id']} ({user.get('email', 'N/A')})</h4>
-                                <span class="user-role">{user.get('role', 'N/A').upper()}</span>
-                            </div>
-                            <p>Last Login: <strong>{datetime.fromisoformat(user['last_login']).strftime('%Y-%m-%d %H:%M')}</strong></p>
-                        </div>
-                        """, unsafe_allow_html=True)
-
-                        # Display API Keys for this user
-                        user_api_keys = list(api_keys_collection.find({"user_id": user['user_id']}))
-                        if user_api_keys:
-                            st.markdown("<h5>Associated API Keys:</h5>", unsafe_allow_html=True)
-                            key_data = []
-                            for key in user_api_keys:
-                                status_color = "green" if key['status'] == 'active' else "red"
-                                key_data.append({
-                                    "Key ID": key['key_id'],
-                                    "API Key (partial)": f"{key['api_key'][:8]}...",
-                                    "API": key['api'],
-                                    "Created At": datetime.fromisoformat(key['created_at']).strftime('%Y-%m-%d'),
-                                    "Expires At": datetime.fromisoformat(key['expires_at']).strftime('%Y-%m-%d'),
-                                    "Status": f"<span style='color:{status_color}; font-weight:bold;'>{key['status'].upper()}</span>"
-                                })
-                            st.write(pd.DataFrame(key_data).to_html(escape=False), unsafe_allow_html=True)
-
-                            # Actions on keys (if Admin)
-                            if current_user_role == "Admin":
-                                with st.expander(f"Manage API Keys for {user['user_id']}"):
-                                    for key in user_api_keys:
-                                        col_key_id, col_status_btn = st.columns([3, 1])
-                                        with col_key_id:
-                                            st.write(f"Key `{key['api_key'][:8]}...` for {key['api']} (Status: {key['status']})")
-                                        with col_status_btn:
-                                            if key['status'] == 'active':
-                                                if st.button("🔴 Deactivate", key=f"deactivate_{key['key_id']}"):
-                                                    update_api_key_status(key['key_id'], "inactive")
-                                            else:
-                                                if st.button("🟢 Activate", key=f"activate_{key['key_id']}"):
-                                                    update_api_key_status(key['key_id'], "active")
-                                            # Feature: API Key Rotation Reminders (2.4)
-                                            expires_at = datetime.fromisoformat(key['expires_at'])
-                                            if expires_at < datetime.utcnow() + timedelta(days=30) and key['status'] == 'active':
-                                                st.warning(f"Key expires soon ({expires_at.strftime('%Y-%m-%d')})! Consider rotation.")
-                                            elif expires_at < datetime.utcnow() and key['status'] == 'active':
-                                                st.error("Key has expired! Please deactivate or rotate.")
+    admin_sub_tabs = st.tabs(["API Key Generation", "Configurable Alerts", "Cost Allocation (Placeholder)"])
 
+    with admin_sub_tabs[0]: # Feature: Generate API Keys (2.1)
+        st.markdown("<h3>Generate New API Keys</h3>", unsafe_allow_html=True)
+        if current_user_role == "Admin":
+            with st.form("generate_key_form"):
+                # Get current users to populate selectbox
+                all_users = get_users()
+                user_ids = [u['user_id'] for u in all_users]
+                key_user_id = st.selectbox("Select User for Key", user_ids + ["Create New User..."])
+                
+                new_user_for_key_input = None
+                if key_user_id == "Create New User...":
+                    new_user_for_key_input = st.text_input("Enter New User ID for Key", key="new_user_for_key_input")
+
+                api_for_key_generation = st.selectbox("Select API for Key", list(API_CONFIGS.keys()), key="api_for_key_generation")
+                submitted_key_gen = st.form_submit_button("Generate Key")
+
+                if submitted_key_gen:
+                    if key_user_id == "Create New User...":
+                        if new_user_for_key_input:
+                            # Add the new user first
+                            users_collection.insert_one({
+                                "user_id": new_user_for_key_input, "email": f"{new_user_for_key_input}@example.com", 
+                                "role": "developer", "last_login": datetime.now(UTC).isoformat(),
+                                "created_at": datetime.now(UTC).isoformat()
+                            })
+                            get_users.clear()
+                            generate_api_key(new_user_for_key_input, api_for_key_generation)
                         else:
-                            st.info(f"No API keys found for {user['user_id']}.")
-                            if current_user_role == "Admin":
-                                if st.button(f"Generate New Key for {user['user_id']}", key=f"gen_key_{user['user_id']}"):
-                                    api_for_new_key = st.selectbox(f"Select API for new key for {user['user_id']}", list(API_CONFIGS.keys()))
-                                    generate_api_key(user['user_id'], api_for_new_key)
-                        st.markdown("---")
-                else:
-                    st.info("No registered users found. Add some dummy users if this is unexpected.")
-                    if st.button("Generate Dummy Users (Admin Only)"):
-                        st.warning("Switch to Admin role in sidebar to generate users.") # Remind user about role
-
-
-            with user_tabs[1]:
-                st.markdown("<h3>Create a New User Account</h3>", unsafe_allow_html=True)
-                if current_user_role == "Admin":
-                    with st.form("new_user_form"):
-                        new_user_id = st.text_input("New User ID (e.g., username)", key="new_user_id_input")
-                        new_user_email = st.text_input("User Email", key="new_user_email_input")
-                        new_user_role = st.selectbox("User Role", ["developer", "admin", "viewer"], key="new_user_role_select")
-                        submitted = st.form_submit_button("Add User")
-                        if submitted:
-                            if new_user_id and new_user_email:
-                                users_collection.insert_one({
-                                    "user_id": new_user_id,
-                                    "email": new_user_email,
-                                    "role": new_user_role,
-                                    "last_login": datetime.utcnow().isoformat(),
-                                    "created_at": datetime.utcnow().isoformat()
-                                })
-                                st.success(f"User {new_user_id} added successfully!")
-                                st.cache_data.clear()
-                                st.rerun()
-                            else:
-                                st.error("User ID and Email are required.")
-                else:
-                    st.warning("You need 'Admin' role to add new users.")
-
-
-        elif tab_name == "Admin Tools":
-            st.header("⚙️ Admin Configuration & Tools")
-
-            admin_sub_tabs = st.tabs(["API Key Generation", "Configurable Alerts", "Cost Allocation (Placeholder)"])
-
-            with admin_sub_tabs[0]: # Feature: Generate API Keys (2.1)
-                st.markdown("<h3>Generate New API Keys</h3>", unsafe_allow_html=True)
-                if current_user_role == "Admin":
-                    with st.form("generate_key_form"):
-                        # Get current users to populate selectbox
-                        all_users = get_users()
-                        user_ids = [u['user_id'] for u in all_users]
-                        key_user_id = st.selectbox("Select User for Key", user_ids + ["Create New User..."])
-                        
-                        new_user_for_key_input = None
-                        if key_user_id == "Create New User...":
-                            new_user_for_key_input = st.text_input("Enter New User ID for Key", key="new_user_for_key_input")
-
-                        api_for_key_generation = st.selectbox("Select API for Key", list(API_CONFIGS.keys()), key="api_for_key_generation")
-                        submitted_key_gen = st.form_submit_button("Generate Key")
-
-                        if submitted_key_gen:
-                            if key_user_id == "Create New User...":
-                                if new_user_for_key_input:
-                                    # Add the new user first
-                                    users_collection.insert_one({
-                                        "user_id": new_user_for_key_input, "email": f"{new_user_for_key_input}@example.com", 
-                                        "role": "developer", "last_login": datetime.utcnow().isoformat(),
-                                        "created_at": datetime.utcnow().isoformat()
-                                    })
-                                    generate_api_key(new_user_for_key_input, api_for_key_generation)
-                                else:
-                                    st.error("Please enter a user ID for the new user.")
-                            else:
-                                generate_api_key(key_user_id, api_for_key_generation)
-                else:
-                    st.warning("You need 'Admin' role to generate API keys.")
-
-            with admin_sub_tabs[1]: # Feature: Configurable Alerts (9) & Anomaly Detection (10)
-                st.markdown("<h3>Alert Configuration (Admin Only)</h3>", unsafe_allow_html=True)
-                if current_user_role == "Admin":
-                    st.info("Here, you would configure rules for alerts (e.g., email me if Image API error rate > 5%).")
-                    st.write("Current Dummy Alerts:")
-                    
-                    st.markdown("""
-                    <div class="alert-config-card">
-                        <h5>High Error Rate Alert (Image API)</h5>
-                        <p><strong>Condition:</strong> `Image API` error rate > `2.0%` for `5 minutes`</p>
-                        <p><strong>Notification:</strong> Email to `admin@example.com`, Slack to `#alerts`</p>
-                        <span class="alert-status-badge active">Active</span>
-                    </div>
-                    <div class="alert-config-card">
-                        <h5>Quota Exceeded Alert (Video API)</h5>
-                        <p><strong>Condition:</strong> `Video API` usage > `90%` of daily quota</p>
-                        <p><strong>Notification:</strong> Email to `devteam@example.com`</p>
-                        <span class="alert-status-badge active">Active</span>
-                    </div>
-                    <div class="alert-config-card inactive">
-                        <h5>High Latency Alert (Weather API)</h5>
-                        <p><strong>Condition:</strong> `Weather API` avg latency > `100ms` for `10 minutes`</p>
-                        <p><strong>Notification:</strong> PagerDuty</p>
-                        <span class="alert-status-badge">Inactive</span>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-                    st.markdown("<h3>Anomaly Detection Status</h3>", unsafe_allow_html=True)
-                    # Simulate anomaly detection based on random chance
-                    if np.random.rand() < 0.2: # 20% chance of an anomaly
-                        st.error("🚨 Anomaly Detected: Unusual spike in `Ecommerce API` calls from a new region (China) at 02:30 AM IST. Investigate immediately!")
+                            st.error("Please enter a user ID for the new user.")
                     else:
-                        st.success("✅ No major anomalies detected recently.")
-                else:
-                    st.warning("You need 'Admin' role to configure alerts or view anomaly details.")
-
-            with admin_sub_tabs[2]: # Feature: Cost Allocation (15)
-                st.markdown("<h3>Cost Allocation (Placeholder)</h3>", unsafe_allow_html=True)
-                st.info("This section would allow configuration and visualization of API costs attributed to different departments, projects, or teams.")
-                st.markdown("""
-                <div class="placeholder-card">
-                    <p>Imagine graphs and tables breaking down costs by:</p>
-                    <ul>
-                        <li>Department (e.g., Marketing, Engineering, Sales)</li>
-                        <li>Project (e.g., Mobile App v1, Web Platform v2)</li>
-                        <li>Cost Centers</li>
-                    </ul>
-                    <p>Requires additional data points in logs (e.g., `department_id`, `project_id`).</p>
-                </div>
-                """, unsafe_allow_html=True)
-
-
-        elif tab_name == "Changelog": # Feature: API Changelog (11)
-            st.header("📜 API Changelog & Version History")
-            st.info("This section provides a history of changes and updates across all APIs.")
-
-            changelogs = {
-                "Image API": [
-                    {"version": "v2.1", "date": "2025-06-15", "changes": "Improved image processing algorithm, reduced latency by 10%."},
-                    {"version": "v2.0", "date": "2025-05-01", "changes": "Major update: New `/process` endpoint, deprecated `/old_process`. Improved stability."},
-                    {"version": "v1.0", "date": "2024-11-20", "changes": "Initial release."}
-                ],
-                "Video API": [
-                    {"version": "v1.5", "date": "2025-04-10", "changes": "Added support for MP4 format. Bug fixes for streaming."},
-                    {"version": "v1.2", "date": "2025-02-01", "changes": "Enhanced metadata extraction."},
-                    {"version": "v1.0", "date": "2024-12-05", "changes": "Initial release."}
-                ],
-                "Weather API": [
-                    {"version": "v3.0", "date": "2025-06-01", "changes": "Migrated to new data source, improved accuracy. New historical data endpoint."},
-                    {"version": "v2.1", "date": "2025-03-20", "changes": "Minor bug fixes and performance improvements."},
-                    {"version": "v2.0", "date": "2024-10-10", "changes": "Major overhaul, new `forecast` endpoint introduced."},
-                ],
-                "Ecommerce API": [
-                    {"version": "v2.3", "date": "2025-05-20", "changes": "Optimized product search API for faster results."},
-                    {"version": "v2.2", "date": "2025-03-01", "changes": "Introduced new `/checkout` endpoint for streamlined purchases."},
-                    {"version": "v2.0", "date": "2024-11-15", "changes": "Initial release of full e-commerce suite."}
-                ],
-                "QR Code API": [
-                    {"version": "v1.2", "date": "2025-04-05", "changes": "Added support for various QR code types."},
-                    {"version": "v1.0", "date": "2025-01-10", "changes": "Initial release."},
-                ],
-                "Profile Photo API": [
-                    {"version": "v2.0", "date": "2025-05-10", "changes": "Improved image resizing and cropping features."},
-                    {"version": "v1.0", "date": "2024-12-20", "changes": "Initial release."}
-                ],
-                "Jokes API": [
-                    {"version": "v1.0", "date": "2025-02-14", "changes": "Initial release with various joke categories."}
-                ]
-            }
-
-            for api, entries in changelogs.items():
-                st.markdown(f"<h3>{api} Changelog</h3>", unsafe_allow_html=True)
-                for entry in entries:
-                    st.markdown(f"""
-                    <div class="changelog-entry">
-                        <div class="version-date">
-                            <span class="version-tag">{entry['version']}</span>
-                            <span class="change-date">{entry['date']}</span>
-                        </div>
-                        <p>{entry['changes']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                st.markdown("---")
+                        generate_api_key(key_user_id, api_for_key_generation)
+        else:
+            st.warning("You need 'Admin' role to generate API keys.")
+
+    with admin_sub_tabs[1]: # Feature: Configurable Alerts (9) & Anomaly Detection (10)
+        st.markdown("<h3>Alert Configuration (Admin Only)</h3>", unsafe_allow_html=True)
+        if current_user_role == "Admin":
+            st.info("Here, you would configure rules for alerts (e.g., email me if Image API error rate > 5%).")
+            st.write("Current Dummy Alerts:")
+            
+            st.markdown("""
+            <div class="alert-config-card">
+                <h5>High Error Rate Alert (Image API)</h5>
+                <p><strong>Condition:</strong> `Image API` error rate > `2.0%` for `5 minutes`</p>
+                <p><strong>Notification:</strong> Email to `admin@example.com`, Slack to `#alerts`</p>
+                <span class="alert-status-badge active">Active</span>
+            </div>
+            <div class="alert-config-card">
+                <h5>Quota Exceeded Alert (Video API)</h5>
+                <p><strong>Condition:</strong> `Video API` usage > `90%` of daily quota</p>
+                <p><strong>Notification:</strong> Email to `devteam@example.com`</p>
+                <span class="alert-status-badge active">Active</span>
+            </div>
+            <div class="alert-config-card inactive">
+                <h5>High Latency Alert (Weather API)</h5>
+                <p><strong>Condition:</strong> `Weather API` avg latency > `100ms` for `10 minutes`</p>
+                <p><strong>Notification:</strong> PagerDuty</p>
+                <span class="alert-status-badge">Inactive</span>
+            </div>
+            """, unsafe_allow_html=True)
+
+            st.markdown("<h3>Anomaly Detection Status</h3>", unsafe_allow_html=True)
+            # Simulate anomaly detection based on random chance
+            if rng.random() < 0.2: # 20% chance of an anomaly
+                st.error("🚨 Anomaly Detected: Unusual spike in `Ecommerce API` calls from a new region (China) at 02:30 AM IST. Investigate immediately!")
+            else:
+                st.success("✅ No major anomalies detected recently.")
+        else:
+            st.warning("You need 'Admin' role to configure alerts or view anomaly details.")
+
+    with admin_sub_tabs[2]: # Feature: Cost Allocation (15)
+        st.markdown("<h3>Cost Allocation (Placeholder)</h3>", unsafe_allow_html=True)
+        st.info("This section would allow configuration and visualization of API costs attributed to different departments, projects, or teams.")
+        st.markdown("""
+        <div class="placeholder-card">
+            <p>Imagine graphs and tables breaking down costs by:</p>
+            <ul>
+                <li>Department (e.g., Marketing, Engineering, Sales)</li>
+                <li>Project (e.g., Mobile App v1, Web Platform v2)</li>
+                <li>Cost Centers</li>
+            </ul>
+            <p>Requires additional data points in logs (e.g., `department_id`, `project_id`).</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+elif tab_name == "Changelog": # Feature: API Changelog (11)
+    st.header("📜 API Changelog & Version History")
+    st.info("This section provides a history of changes and updates across all APIs.")
+
+    # Only the chosen API's pre-rendered section is sent to the page
+    changelog_sections = changelog_html()
+    changelog_api = st.selectbox("Select API", list(changelog_sections), key="changelog_api")
+    st.markdown(changelog_sections[changelog_api], unsafe_allow_html=True)
 
 
 st.markdown("---")
@@ -1081,40 +1500,49 @@ support_tabs = st.tabs(support_tab_titles)
 
 with support_tabs[0]:
     st.markdown("<h3>Currently Active Support Requests</h3>", unsafe_allow_html=True)
-    open_tickets = list(tickets_collection.find({"status": "open"}))
+    if tickets_changed.is_set(): # Tickets written elsewhere (e.g. opened from the chatbot) since the last run
+        tickets_changed.clear()
+        get_open_tickets.clear()
+        get_closed_tickets.clear()
+    open_tickets = get_open_tickets()
 
     if open_tickets:
-        for ticket in open_tickets:
-            created_at = datetime.fromisoformat(ticket["created_at"])
-            ticket["hours_open"] = round((datetime.utcnow() - created_at).total_seconds() / 3600, 2)
-        
-        open_tickets_sorted = sorted(open_tickets, key=lambda x: x["hours_open"], reverse=True)
-
-        for ticket in open_tickets_sorted:
-            border_color = "#7cb342"
-            if ticket["hours_open"] > 24:
-                border_color = "#ff8a65"
-            if ticket["hours_open"] > 72:
-                border_color = "#ef5350"
-
-            st.markdown(f"""
-            <div class="ticket-card" style="border-left: 8px solid {border_color};">
-                <div class="ticket-header">
-                    <span class="ticket-id">Ticket ID: <code>{ticket['_id']}</code></span>
-                    <span class="ticket-aging">Aging: <strong>{ticket['hours_open']} hours</strong></span>
-                </div>
-                <p><strong>Query:</strong> {ticket['query']}</p>
-                <p><strong>Contact:</strong> {ticket.get('contact', 'anonymous')}</p>
-                <p><strong>Status:</strong> <span class="status-open">OPEN</span></p>
-                <div class="ticket-button-container">
-                    <!-- Only one Streamlit button, styled with CSS -->
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            # This is the *single* Streamlit button. The CSS below will style it red.
-            if st.button("Close Ticket", key=f"close_btn_{ticket['_id']}", use_container_width=True):
-                tickets_collection.update_one({"_id": ticket["_id"]}, {"$set": {"status": "closed", "closed_at": datetime.utcnow().isoformat()}})
-                st.success(f"Ticket #{ticket['_id']} closed successfully!")
+        # Already ordered oldest-first (largest hours_open) by the pipeline; only one page is rendered
+        page_count = -(-len(open_tickets) // TICKET_PAGE_SIZE)
+        open_page = min(st.session_state.setdefault("open_page", 0), page_count - 1)
+        col_prev, col_page, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            if st.button("◀ Previous", key="open_page_prev", disabled=open_page == 0):
+                st.session_state["open_page"] = open_page - 1
+                st.rerun()
+        with col_page:
+            st.caption(f"Page {open_page + 1} of {page_count} ({len(open_tickets)} open tickets)")
+        with col_next:
+            if st.button("Next ▶", key="open_page_next", disabled=open_page >= page_count - 1):
+                st.session_state["open_page"] = open_page + 1
+                st.rerun()
+        open_tickets_sorted = open_tickets[open_page * TICKET_PAGE_SIZE:(open_page + 1) * TICKET_PAGE_SIZE]
+
+        # Build every card first and emit them in a single markdown call. The joined HTML is kept in
+        # session_state against the page's (id, age) pairs, so unrelated reruns reuse it as-is.
+        open_sig = hash(tuple((ticket["_id"], ticket["hours_open"]) for ticket in open_tickets_sorted))
+        cached_open = st.session_state.get("open_tickets_html")
+        if cached_open is None or cached_open[0] != open_sig:
+            cached_open = (open_sig, "\n".join(open_ticket_card(ticket) for ticket in open_tickets_sorted))
+            st.session_state["open_tickets_html"] = cached_open
+        st.markdown(cached_open[1], unsafe_allow_html=True)
+
+        # One form with a multiselect, however many tickets are on the page; closed in one update_many round-trip
+        with st.form("close_tickets_form"):
+            selected_ticket_ids = st.multiselect("Select tickets to close", [ticket["_id"] for ticket in open_tickets_sorted],
+                                                 format_func=lambda ticket_id: f"Ticket {ticket_id}")
+            # The CSS below will style this button red.
+            if st.form_submit_button("Close Selected Tickets", use_container_width=True) and selected_ticket_ids:
+                tickets_collection.update_many({"_id": {"$in": selected_ticket_ids}}, {"$set": {"status": "closed", "closed_at": datetime.now(UTC)}})
+                # The ticket caches are shared by every session, so drop them outright; logs stay cached
+                get_open_tickets.clear()
+                get_closed_tickets.clear()
+                st.success(f"Closed {len(selected_ticket_ids)} ticket(s) successfully!")
                 st.rerun()
 
     else:
@@ -1122,666 +1550,15 @@ with support_tabs[0]:
 
 with support_tabs[1]:
     st.markdown("<h3>Recently Closed Support Requests</h3>", unsafe_allow_html=True)
-    closed_tickets = list(tickets_collection.find({"status": "closed"}).sort("closed_at", -1).limit(20))
+    closed_tickets = get_closed_tickets()
 
     if closed_tickets:
-        for ticket in closed_tickets:
-            closed_at_str = ticket.get("closed_at", datetime.utcnow().isoformat())
-            closed_at = datetime.fromisoformat(closed_at_str)
-            
-            st.markdown(f"""
-            <div class="ticket-card closed-ticket">
-                <div class="ticket-header">
-                    <span class="ticket-id">Ticket ID: <code>{ticket['_id']}</code></code></span>
-                    <span class="ticket-aging">Closed: <strong>{closed_at.strftime('%Y-%m-%d %H:%M')}</strong></span>
-                </div>
-                <p><strong>Query:</strong> {ticket['query']}</p>
-                <p><strong>Contact:</strong> {ticket.get('contact', 'anonymous')}</p>
-                <p><strong>Status:</strong> <span class="status-closed">CLOSED</span></p>
-            </div>
-            """, unsafe_allow_html=True)
+        # Same single-emit, signature-cached pattern as the open tickets
+        closed_sig = hash(tuple((ticket["_id"], ticket["closed_display"]) for ticket in closed_tickets))
+        cached_closed = st.session_state.get("closed_tickets_html")
+        if cached_closed is None or cached_closed[0] != closed_sig:
+            cached_closed = (closed_sig, "\n".join(closed_ticket_card(ticket) for ticket in closed_tickets))
+            st.session_state["closed_tickets_html"] = cached_closed
+        st.markdown(cached_closed[1], unsafe_allow_html=True)
     else:
         st.info("No closed support tickets found.")
-
-# --- Custom CSS for a stunning UI ---
-st.markdown("""
-<style>
-    /* Overall App Styling */
-    .stApp {
-        background-color: #000000; /* Solid Black Background */
-        color: #e0e6f0; /* Soft white/light grey text */
-        font-family: 'Inter', sans-serif; /* Modern font */
-        -webkit-font-smoothing: antialiased;
-        -moz-osx-font-smoothing: grayscale;
-    }
-
-    /* Main Title */
-    h1 {
-        color: #5b9bd5; /* Steel Blue for title */
-        text-align: center;
-        padding-bottom: 25px;
-        border-bottom: 2px solid #4a6078; /* Clean separator */
-        margin-bottom: 50px;
-        font-size: 3.2rem; /* Larger font size */
-        letter-spacing: 1.5px; /* Spacing for a cleaner look */
-        font-weight: 700; /* Bold title */
-        text-shadow: 0px 0px 10px rgba(91, 155, 213, 0.4); /* Subtle glow */
-    }
-
-    /* Subheaders */
-    h2, h3, h4, h5, h6 {
-        color: #ab47bc; /* Amethyst */
-        margin-top: 2.5rem;
-        margin-bottom: 1.5rem;
-        border-left: 6px solid #7cb342; /* Lime Green accent border */
-        padding-left: 18px;
-        font-weight: 600; /* Semi-bold */
-        letter-spacing: 0.8px;
-        opacity: 0; /* Initial state for animation */
-        transform: translateY(20px); /* Initial state for animation */
-        animation: fadeInSlideUp 0.8s ease-out forwards; /* Apply animation */
-    }
-    h2 { font-size: 2.3rem; }
-    h3 { font-size: 1.9rem; }
-    h4 { font-size: 1.6rem; color: #5b9bd5; margin-bottom: 1rem; } /* Reverted h4 color to blue for contrast */
-    h5 { font-size: 1.3rem; color: #7cb342; margin-bottom: 0.8rem; }
-
-
-    /* Keyframe for fade-in slide up */
-    @keyframes fadeInSlideUp {
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-
-    /* Buttons */
-    .stButton>button {
-        background-color: red; /* Lime Green */
-        color: #1a1a1a; /* Dark text for contrast */
-        border-radius: 10px;
-        border: none;
-        padding: 14px 30px;
-        font-size: 1.15rem;
-        cursor: pointer;
-        transition: background-color 0.3s ease, transform 0.2s cubic-bezier(0.34, 1.56, 0.64, 1), box-shadow 0.3s ease; /* Bouncier transform */
-        box-shadow: 0 5px 15px rgba(0, 0, 0, 0.4), inset 0 1px 3px rgba(255, 255, 255, 0.15); /* Soft 3D */
-        font-weight: bold;
-        letter-spacing: 0.5px;
-    }
-    .stButton>button:hover {
-        background-color: orange; 
-        transform: translateY(-5px) scale(1.03); /* More lift and scale */
-        box-shadow: 0 10px 25px rgba(0, 0, 0, 0.5), inset 0 1px 4px rgba(255, 255, 255, 0.2);
-    }
-    .stButton>button:active {
-        transform: translateY(1px) scale(0.97); /* Deeper press */
-        box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2), inset 0 1px 3px rgba(255, 255, 255, 0.08);
-    }
-
-    /* Close Ticket Button specific styling */
-    .stButton button[key*="close_btn_"] { /* Target close ticket buttons by key prefix */
-        background-color: #ef5350 !important; /* Red color */
-        color: white !important;
-        border: none;
-        padding: 10px 20px !important;
-        border-radius: 8px !important;
-        font-weight: bold !important;
-        cursor: pointer;
-        transition: background-color 0.3s ease, transform 0.2s cubic-bezier(0.34, 1.56, 0.64, 1), box-shadow 0.3s ease;
-        box-shadow: 0 3px 8px rgba(0, 0, 0, 0.2);
-    }
-    .stButton button[key*="close_btn_"]:hover {
-        background-color: #c62828 !important; /* Darker red on hover */
-        transform: translateY(-3px) !important;
-        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.3) !important;
-    }
-    .stButton button[key*="close_btn_"]:active {
-        transform: translateY(1px) !important;
-        box_shadow: 0 1px 4px rgba(0, 0, 0, 0.1) !important;
-    }
-
-
-    /* Generic link button style (for Docs link) */
-    .button-link {
-        display: inline-block;
-        background-color: #4a4a4a; /* Changed blue to dark grey */
-        color: white !important; /* Important to override default link color */
-        padding: 10px 20px;
-        border-radius: 8px;
-        text-decoration: none;
-        font-weight: bold;
-        transition: background-color 0.3s, transform 0.2s;
-        box-shadow: 0 3px 10px rgba(0, 0, 0, 0.3);
-    }
-    .button-link:hover {
-        background-color: #333333; /* Darker grey on hover */
-        transform: translateY(-2px);
-        box-shadow: 0 5px 15px rgba(0, 0, 0, 0.4);
-    }
-
-    /* Top-level Tabs (API Navigation) - For main API tabs AND now for metrics tabs */
-    .stTabs [data-baseweb="tab-list"] {
-        justify-content: flex-start; /* Align tabs to start (left) */
-        gap: 20px; /* Consistent gap between tabs */
-        padding-bottom: 25px;
-        border-bottom: 2px solid #4a6078;
-        margin-bottom: 40px;
-        overflow-x: auto; /* Enable horizontal scrolling */
-        white-space: nowrap; /* Prevent tabs from wrapping */
-        -webkit-overflow-scrolling: touch; /* Smoother scrolling on touch devices */
-        padding-top: 10px;
-        padding-left: 20px; /* Crucial: Add sufficient left padding to reveal clipped content */
-        padding-right: 20px; /* Add right padding for consistency */
-    }
-
-    /* Style the scrollbar for tabs */
-    .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar {
-        height: 10px; /* Thicker scrollbar */
-    }
-    .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar-track {
-        background: #1a1a1a; /* Black track */
-        border-radius: 10px;
-    }
-    .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar-thumb {
-        background: #4a4a4a; /* Dark grey thumb */
-        border-radius: 10px;
-    }
-    .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar-thumb:hover {
-        background: #333333; /* Even darker grey on hover */
-    }
-
-    .stTabs [data-baseweb="tab"] {
-        padding: 16px 28px;
-        border-radius: 15px;
-        transition: background-color 0.3s, color 0.3s, box-shadow 0.3s, transform 0.2s cubic-bezier(0.34, 1.56, 0.64, 1);
-        font-weight: 600;
-        color: #b0c4de;
-        background-color: #2b3e50;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3), inset 0 1px 2px rgba(255, 255, 255, 0.1);
-        border: 1px solid #4a6078;
-        flex-shrink: 0;
-        animation: tabFadeIn 0.5s ease-out forwards;
-        opacity: 0;
-    }
-    /* Add animation delay for each tab */
-    .stTabs [data-baseweb="tab"]:nth-child(1) { animation-delay: 0.1s; }
-    .stTabs [data-baseweb="tab"]:nth-child(2) { animation-delay: 0.2s; }
-    .stTabs [data-baseweb="tab"]:nth-child(3) { animation-delay: 0.3s; }
-    .stTabs [data-baseweb="tab"]:nth-child(4) { animation-delay: 0.4s; }
-    .stTabs [data-baseweb="tab"]:nth-child(5) { animation-delay: 0.5s; }
-    .stTabs [data-baseweb="tab"]:nth-child(6) { animation-delay: 0.6s; }
-    .stTabs [data-baseweb="tab"]:nth-child(7) { animation-delay: 0.7s; }
-    .stTabs [data-baseweb="tab"]:nth-child(8) { animation-delay: 0.8s; }
-    .stTabs [data-baseweb="tab"]:nth-child(9) { animation-delay: 0.9s; }
-    .stTabs [data-baseweb="tab"]:nth-child(10) { animation-delay: 1.0s; } /* For new tabs */
-    .stTabs [data-baseweb="tab"]:nth-child(11) { animation-delay: 1.1s; }
-    .stTabs [data-baseweb="tab"]:nth-child(12) { animation-delay: 1.2s; }
-
-
-    @keyframes tabFadeIn {
-        from { opacity: 0; transform: translateY(10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    .stTabs [data-baseweb="tab"]:hover {
-        background-color: #3d5a73;
-        color: #e0e6f0;
-        transform: translateY(-4px) scale(1.02);
-        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.4), inset 0 1px 3px rgba(255, 255, 255, 0.2);
-    }
-    .stTabs [data-baseweb="tab"][aria-selected="true"] {
-        background-color: #5b9bd5; /* Keep blue for selected tab background */
-        color: white;
-        box-shadow: 0 10px 25px rgba(0, 0, 0, 0.5), inset 0 2px 5px rgba(255, 255, 255, 0.3);
-        border: 1px solid #5b9bd5;
-        transform: translateY(-3px);
-    }
-    .stTabs [data-baseweb="tab-list"] button [data-testid="stMarkdownContainer"] p {
-        font-size: 1.2rem;
-        font-weight: bold;
-        margin: 0;
-    }
-
-    /* Adjustments for the new metric tabs - inherit from stTabs styles now */
-    /* The `stRadio` specific styles are removed as it's no longer a radio group */
-    /* The .stRadio > label will still apply to the "Select a metric" H4 if it were there,
-       but now it's a direct H4 which will inherit its styling from the H4 rule */
-    /* No special overrides needed for scrollability on the metric tabs themselves,
-       as they will now correctly use the .stTabs [data-baseweb="tab-list"] styling */
-
-
-    /* Alerts */
-    .stAlert {
-        border-radius: 12px;
-        padding: 20px 25px;
-        font-size: 1.05rem;
-        margin-top: 25px;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-        animation: fadeIn 0.5s ease-out forwards;
-    }
-    .stAlert.st-success { background-color: #1e3a24; border-left: 8px solid #7cb342; }
-    .stAlert.st-info { background-color: #1e2e3a; border-left: 8px solid #4a4a4a; } /* Changed blue to dark grey for info alerts */
-    .stAlert.st-warning { background-color: #3a321e; border-left: 8px solid #ff8a65; }
-    .stAlert.st-error { background-color: #3a1e1e; border-left: 8px solid #ef5350; }
-    @keyframes fadeIn { from { opacity: 0; } to { opacity: 1; } }
-
-    /* Metrics (KPIs) with dynamic values and subtle animation */
-    .stMetric > div {
-        background-color: #101115; /* Updated to new color #101115 */
-        border-radius: 12px;
-        padding: 25px;
-        margin-bottom: 25px;
-        box-shadow: 0 6px 18px rgba(0, 0, 0, 0.4), inset 0 1px 3px rgba(255, 255, 255, 0.15);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        overflow: hidden;
-    }
-    .stMetric > div:hover {
-        transform: translateY(-8px) scale(1.02);
-        box-shadow: 0 12px 30px rgba(0, 0, 0, 0.5), inset 0 1px 4px rgba(255, 255, 255, 0.2);
-    }
-    .stMetric > div > div:first-child {
-        font-size: 1.25rem;
-        color: #b0c4de;
-        font-weight: 500;
-        margin-bottom: 8px;
-    }
-    .stMetric > div > div:last-child {
-        font-size: 3.2rem;
-        font-weight: 700;
-        color: #e0e6f0;
-        text-shadow: 1px 1px 5px rgba(0,0,0,0.5);
-        animation: valueFadeInUp 0.6s ease-out;
-    }
-    @keyframes valueFadeInUp {
-        from { opacity: 0; transform: translateY(10px); }
-        to { opacity: 1; transform: translateY(0); }
-    }
-
-    /* Plotly chart container */
-    .stPlotlyChart {
-        border-radius: 12px;
-        overflow: hidden;
-        border: 2px solid #4a6078;
-        box-shadow: 0 6px 18px rgba(0, 0, 0, 0.4);
-        margin-top: 25px;
-        animation: fadeInScale 0.7s ease-out forwards;
-        opacity: 0;
-        transform: scale(0.98);
-    }
-    @keyframes fadeInScale {
-        to { opacity: 1; transform: scale(1); }
-    }
-
-    /* Streamlit dataframes */
-    .stDataFrame {
-        border-radius: 12px;
-        overflow: hidden;
-        border: 2px solid #4a6078;
-        box-shadow: 0 6px 18px rgba(0, 0, 0, 0.4);
-        margin-top: 25px;
-    }
-    .stDataFrame table {
-        color: #e0e6f0;
-        background-color: #2b3e50;
-    }
-    .stDataFrame th {
-        background-color: #3d5a73 !important;
-        color: #b0c4de !important;
-        font-weight: bold;
-        border-bottom: 1px solid #4a6078;
-    }
-    .stDataFrame td {
-        background-color: #101115 !important;
-        color: #e0e6f0 !important;
-        border-bottom: 1px solid rgba(74, 96, 120, 0.2);
-    }
-
-    /* General text/paragraph styling */
-    p {
-        font-size: 1.05rem;
-        line-height: 1.7;
-        color: #e0e6f0;
-    }
-    b, strong {
-        color: #e0e6f0;
-    }
-    code {
-        background-color: #3d5a73;
-        border-radius: 6px;
-        padding: 3px 8px;
-        font-size: 0.95rem;
-        color: #b0c4de;
-        font-family: 'Fira Code', 'Cascadia Code', monospace;
-        font-weight: normal;
-    }
-
-    /* Horizontal Rule */
-    hr {
-        border-top: 3px solid #4a6078;
-        margin-top: 3.5rem;
-        margin-bottom: 3.5rem;
-    }
-
-    /* Support Ticket Cards */
-    .ticket-card {
-        background-color: #101115;
-        border: 1px solid #4a6078;
-        border-radius: 12px;
-        padding: 20px 25px;
-        margin-bottom: 20px;
-        box-shadow: 0 5px 15px rgba(0, 0, 0, 0.3), inset 0 1px 3px rgba(255, 255, 255, 0.1);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        display: flex;
-        flex-direction: column;
-        justify-content: space-between;
-        animation: ticketSlideIn 0.6s ease-out forwards;
-        opacity: 0;
-        transform: translateX(-20px);
-    }
-    .ticket-card:nth-child(1) { animation-delay: 0.1s; }
-    .ticket-card:nth-child(2) { animation-delay: 0.2s; }
-    .ticket-card:nth-child(3) { animation-delay: 0.3s; }
-    .ticket-card:nth-child(4) { animation-delay: 0.4s; }
-
-    @keyframes ticketSlideIn {
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-
-    .ticket-card:hover {
-        transform: translateY(-6px);
-        box-shadow: 0 10px 25px rgba(0, 0, 0, 0.4), inset 0 1px 4px rgba(255, 255, 255, 0.15);
-    }
-
-    .ticket-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 10px;
-        padding-bottom: 8px;
-        border-bottom: 1px solid rgba(74, 96, 120, 0.3);
-    }
-
-    .ticket-id {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #b0c4de;
-    }
-    .ticket-id code {
-        background-color: #3d5a73;
-        color: #b0c4de;
-        padding: 2px 6px;
-        border-radius: 4px;
-    }
-
-    .ticket-aging {
-        font-size: 0.95rem;
-        color: #e0e6f0;
-    }
-    .ticket-aging strong {
-        color: #ff8a65;
-    }
-
-    .ticket-card p {
-        margin-bottom: 0.8em;
-    }
-
-    .status-open {
-        color: #7cb342;
-        font-weight: bold;
-        text-transform: uppercase;
-        font-size: 0.95rem;
-    }
-    .status-closed {
-        color: #5b9bd5;
-        font-weight: bold;
-        text-transform: uppercase;
-        font-size: 0.95rem;
-    }
-
-    .closed-ticket {
-        opacity: 0.7;
-        filter: grayscale(20%);
-        border-left: 8px solid #5b9bd5 !important;
-    }
-
-    .ticket-button-container {
-        margin-top: 15px;
-        text-align: right;
-    }
-
-    /* API Health Card Styling and Animations */
-    .api-health-card {
-        display: flex;
-        align-items: center;
-        background-color: #101115;
-        border-radius: 12px;
-        padding: 25px 30px;
-        margin-top: 25px;
-        box-shadow: 0 6px 18px rgba(0, 0, 0, 0.4), inset 0 1px 3px rgba(255, 255, 255, 0.15);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-        animation: fadeIn 0.8s ease-out forwards;
-        opacity: 0;
-    }
-    .api-health-card:hover {
-        transform: translateY(-8px);
-        box-shadow: 0 12px 30px rgba(0, 0, 0, 0.5), inset 0 1px 4px rgba(255, 255, 255, 0.2);
-        background-color: #1A1C1A;
-    }
-
-    .health-icon {
-        margin-right: 25px;
-        line-height: 1;
-    }
-
-    .health-details p {
-        margin: 0;
-        padding: 0;
-        line-height: 1.5;
-        font-size: 1.1rem;
-    }
-    .health-details strong {
-        font-size: 1.2rem;
-    }
-
-    /* Pulse animations for health icons */
-    @keyframes pulse-green {
-        0% { transform: scale(1); opacity: 1; }
-        50% { transform: scale(1.1); opacity: 0.8; }
-        100% { transform: scale(1); opacity: 1; }
-    }
-    @keyframes pulse-orange {
-        0% { transform: scale(1); opacity: 1; }
-        50% { transform: scale(1.15); opacity: 0.7; }
-        100% { transform: scale(1); opacity: 1; }
-    }
-    @keyframes pulse-red {
-        0% { transform: scale(1); opacity: 1; }
-        50% { transform: scale(1.2); opacity: 0.6; }
-        100% { transform: scale(1); opacity: 1; }
-    }
-
-    /* User Card Styling */
-    .user-card {
-        background-color: #101115;
-        border: 1px solid #4a6078;
-        border-radius: 12px;
-        padding: 20px;
-        margin-bottom: 20px;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-        transition: transform 0.2s ease;
-    }
-    .user-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 8px 20px rgba(0, 0, 0, 0.4);
-        background-color: #1A1C1A;
-    }
-    .user-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 10px;
-        padding-bottom: 8px;
-        border-bottom: 1px solid rgba(74, 96, 120, 0.3);
-    }
-    .user-header h4 {
-        margin: 0;
-        color: #5b9bd5;
-        font-size: 1.4rem;
-    }
-    .user-role {
-        background-color: #ab47bc;
-        color: white;
-        padding: 5px 12px;
-        border-radius: 8px;
-        font-size: 0.9rem;
-        font-weight: bold;
-    }
-    .user-card p {
-        margin-bottom: 0.5em;
-    }
-
-    /* Alert Config Card Styling */
-    .alert-config-card {
-        background-color: #101115;
-        border: 1px solid #4a6078;
-        border-left: 8px solid #ab47bc; /* Amethyst accent */
-        border-radius: 12px;
-        padding: 20px 25px;
-        margin-bottom: 20px;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-        transition: transform 0.2s ease;
-    }
-    .alert-config-card.inactive {
-        opacity: 0.6;
-        border-left: 8px solid #4a6078; /* Grey accent for inactive */
-    }
-    .alert-config-card h5 {
-        margin-top: 0;
-        color: #7cb342;
-        font-size: 1.3rem;
-    }
-    .alert-config-card p {
-        margin-bottom: 0.5em;
-    }
-    .alert-status-badge {
-        display: inline-block;
-        padding: 4px 10px;
-        border-radius: 5px;
-        font-size: 0.85rem;
-        font-weight: bold;
-        text-transform: uppercase;
-        margin-top: 10px;
-        background-color: #ff8a65; /* Default for inactive/general */
-        color: #1a1a1a;
-    }
-    .alert-status-badge.active {
-        background-color: #7cb342;
-    }
-
-    /* Placeholder Card */
-    .placeholder-card {
-        background-color: #101115;
-        border: 1px solid #4a6078;
-        border-radius: 12px;
-        padding: 20px 25px;
-        margin-top: 20px;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
-    }
-    .placeholder-card ul {
-        list-style-type: disc;
-        margin-left: 20px;
-        padding-left: 0;
-    }
-    .placeholder-card li {
-        margin-bottom: 5px;
-        color: #e0e6f0;
-    }
-
-    /* Changelog Entry */
-    .changelog-entry {
-        background-color: #101115;
-        border: 1px solid #4a6078;
-        border-left: 8px solid #4a4a4a; /* Changed blue accent to dark grey */
-        border-radius: 12px;
-        padding: 20px 25px;
-        margin-bottom: 15px;
-        box-shadow: 0 3px 10px rgba(0, 0, 0, 0.2);
-        animation: fadeIn 0.6s ease-out forwards;
-        opacity: 0;
-        transform: translateY(10px);
-    }
-    .changelog-entry:nth-child(odd) { animation-delay: 0.1s; }
-    .changelog-entry:nth-child(even) { animation-delay: 0.2s; }
-    .changelog-entry .version-date {
-        display: flex;
-        align-items: center;
-        margin-bottom: 10px;
-    }
-    .changelog-entry .version-tag {
-        background-color: #ab47bc;
-        color: white;
-        padding: 5px 12px;
-        border-radius: 8px;
-        font-weight: bold;
-        font-size: 0.9em;
-        margin-right: 15px;
-    }
-    .changelog-entry .change-date {
-        color: #b0c4de;
-        font-size: 0.95em;
-    }
-    .changelog-entry p {
-        margin: 0;
-        font-size: 1em;
-        color: #e0e6f0;
-    }
-
-    /* Streamlit Date Input specific styling */
-    .stDateInput > label {
-        color: #ab47bc; /* Match subheader color */
-        font-weight: bold;
-        font-size: 1.25rem;
-        margin-bottom: 15px;
-    }
-    .stDateInput [data-baseweb="input"] {
-        background-color: #2b3e50;
-        color: #e0e6f0;
-        border: 1px solid #4a6078;
-        border-radius: 8px;
-        padding: 8px 12px;
-    }
-    .stDateInput [data-baseweb="input"] input {
-        color: #e0e6f0;
-    }
-    .stDateInput [data-baseweb="button"] { /* Calendar icon button */
-        background-color: #3d5a73;
-        color: #b0c4de;
-        border-radius: 8px;
-    }
-    .stDateInput [data-baseweb="button"]:hover {
-        background-color: #4a6078;
-    }
-    
-    /* New CSS rule for the API Info Display Card */
-    .api-info-display-card {
-        background-color: #101115; /* The requested color */
-        padding: 20px;
-        border-radius: 12px;
-        margin-bottom: 30px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.3);
-        border: 1px solid #4a6078; /* Added a subtle border */
-    }
-
-    :root {
-        --primary-font: 'Inter', sans-serif;
-        --background-color: #000000; /* THIS LINE */
-        --secondary-background-color: #1a1a1a;
-        /* ... other variables ... */
-    }
-
-</style>
-""", unsafe_allow_html=True)
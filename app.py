@@ -1,40 +1,33 @@
 import streamlit as st
 from streamlit.components.v1 import html
+import os
 import random
+import re
 
-def zipper_interface():
-    return f"""
+# Static page: a plain constant built once at import, so reruns don't re-format tens of KB of f-string
+ZIPPER_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Ultra-Realistic 3D Zipper Interface</title>
+    <!-- Open the connection to the chatbot app early so its reveal doesn't wait on connection setup -->
+    <link rel="preconnect" href="http://localhost:8502">
+    <link rel="dns-prefetch" href="http://localhost:8502">
     <link href="https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;600;700&family=Playfair+Display:wght@400;700&display=swap" rel="stylesheet">
     <style>
-        /* CSS RESET */
-        html, body, div, span, applet, object, iframe,
-        h1, h2, h3, h4, h5, h6, p, blockquote, pre,
-        a, abbr, acronym, address, big, cite, code,
-        del, dfn, em, img, ins, kbd, q, s, samp,
-        small, strike, strong, sub, sup, tt, var,
-        b, u, i, center,
-        dl, dt, dd, ol, ul, li,
-        fieldset, form, label, legend,
-        table, caption, tbody, tfoot, thead, tr, th, td,
-        article, aside, canvas, details, embed, 
-        figure, figcaption, footer, header, hgroup, 
-        menu, nav, output, ruby, section, summary,
-        time, mark, audio, video {{
+        /* CSS RESET: the page only uses a handful of elements, so one universal rule does the job */
+        * {
             margin: 0;
             padding: 0;
             border: 0;
             font-size: 100%;
             font: inherit;
             vertical-align: baseline;
-        }}
+        }
         
-        html, body {{
+        html, body {
             margin: 0 !important;
             padding: 0 !important;
             width: 100vw !important;
@@ -45,10 +38,10 @@ def zipper_interface():
             perspective: 1800px;
             background: #0a0a12;
             color: #f0f0f0;
-        }}
+        }
 
         /* MAIN CONTAINER */
-        .main-container {{
+        .main-container {
             position: fixed;
             top: 0;
             left: 0;
@@ -56,10 +49,19 @@ def zipper_interface():
             height: 100vh;
             overflow: hidden;
             background: radial-gradient(circle at center, #1a1a2e 0%, #0a0a12 100%);
-        }}
+            /* Zipper travel, 0 (closed) -> 1 (open); the only value JS writes per frame */
+            --zip-progress: 0;
+            /* Panel "keyframes" over that travel: each value is start + delta * progress */
+            --panel-shift: 100vw;
+            --panel-rotate-y: 15deg;
+            --panel-skew-y: 5deg;
+            --panel-opacity-delta: -1.5;
+            --panel-scale-delta: -0.2;
+            --chatbot-reveal-rate: 1.5;
+        }
 
         /* ULTRA-REALISTIC ZIPPER TRACK */
-        .zipper-track {{
+        .zipper-track {
             position: absolute;
             top: 0;
             left: 50%;
@@ -78,9 +80,9 @@ def zipper_interface():
             z-index: 10;
             border-left: 2px solid rgba(255,255,255,0.1);
             border-right: 2px solid rgba(255,255,255,0.1);
-        }}
+        }
 
-        .zipper-teeth {{
+        .zipper-teeth {
             position: absolute;
             width: 100%;
             height: 100%;
@@ -97,9 +99,9 @@ def zipper_interface():
             background-size: 72px 40px;
             background-repeat: repeat-y;
             filter: drop-shadow(0 1px 1px rgba(0,0,0,0.5));
-        }}
+        }
 
-        .zipper-track::before, .zipper-track::after {{
+        .zipper-track::before, .zipper-track::after {
             content: "";
             position: absolute;
             top: 0;
@@ -108,9 +110,9 @@ def zipper_interface():
             background-repeat: repeat-y;
             background-size: 24px 40px;
             z-index: 2;
-        }}
+        }
 
-        .zipper-track::before {{
+        .zipper-track::before {
             left: 0;
             background-image: 
                 linear-gradient(to right, 
@@ -118,9 +120,9 @@ def zipper_interface():
                     rgba(180,180,180,0.9) 50%, 
                     transparent 50%);
             border-right: 1px solid rgba(255,255,255,0.3);
-        }}
+        }
 
-        .zipper-track::after {{
+        .zipper-track::after {
             right: 0;
             background-image: 
                 linear-gradient(to left, 
@@ -128,10 +130,10 @@ def zipper_interface():
                     rgba(180,180,180,0.9) 50%, 
                     transparent 50%);
             border-left: 1px solid rgba(255,255,255,0.3);
-        }}
+        }
 
         /* ZIPPER SLIDER - ULTRA REALISTIC */
-        .zipper-slider {{
+        .zipper-slider {
             position: absolute;
             top: 0;
             left: 50%;
@@ -144,10 +146,17 @@ def zipper_interface():
             filter: 
                 drop-shadow(0 5px 15px rgba(0,0,0,0.5))
                 drop-shadow(0 10px 30px rgba(0,0,0,0.3));
-            transition: transform 0.1s ease-out;
-        }}
+            backface-visibility: hidden;
+            /* No transform transition: position is written every frame and must not lag the pointer.
+               Only the grab "pop" is tweened, via the independent scale property */
+            transition: scale 0.1s ease-out;
+        }
+
+        .zipper-slider.grabbed {
+            scale: 1.02;
+        }
 
-        .slider-body {{
+        .slider-body {
             position: absolute;
             width: 80px;
             height: 80px;
@@ -161,9 +170,9 @@ def zipper_interface():
                 0 10px 20px rgba(0,0,0,0.4);
             transform-style: preserve-3d;
             transform: rotateX(15deg);
-        }}
+        }
 
-        .slider-top {{
+        .slider-top {
             position: absolute;
             width: 80px;
             height: 15px;
@@ -176,9 +185,9 @@ def zipper_interface():
                 inset 0 -5px 10px rgba(0,0,0,0.2);
             transform-origin: bottom;
             transform: rotateX(-15deg);
-        }}
+        }
 
-        .slider-bottom {{
+        .slider-bottom {
             position: absolute;
             width: 80px;
             height: 25px;
@@ -189,9 +198,9 @@ def zipper_interface():
             box-shadow: 
                 inset 0 5px 10px rgba(0,0,0,0.4),
                 0 5px 10px rgba(0,0,0,0.3);
-        }}
+        }
 
-        .slider-pull {{
+        .slider-pull {
             position: absolute;
             width: 60px;
             height: 80px;
@@ -207,16 +216,16 @@ def zipper_interface():
             transform-origin: top;
             transform: rotateX(20deg);
             transition: transform 0.4s cubic-bezier(0.68, -0.55, 0.265, 1.55);
-        }}
+        }
 
-        .slider-pull.up {{
+        .slider-pull.up {
             transform: rotateX(160deg);
             box-shadow: 
                 0 10px 20px rgba(0,0,0,0.5),
                 inset 0 10px 20px rgba(0,0,0,0.3);
-        }}
+        }
 
-        .slider-pull-ring {{
+        .slider-pull-ring {
             position: absolute;
             width: 60px;
             height: 30px;
@@ -227,9 +236,9 @@ def zipper_interface():
             border-top: none;
             border-radius: 0 0 30px 30px;
             box-shadow: 0 5px 10px rgba(0,0,0,0.3);
-        }}
+        }
 
-        .slider-pull-ring::before {{
+        .slider-pull-ring::before {
             content: "";
             position: absolute;
             width: 40px;
@@ -239,9 +248,9 @@ def zipper_interface():
             background: radial-gradient(ellipse at center, #7a7a7a 0%, #5a5a5a 70%, #3a3a3a 100%);
             border-radius: 50%;
             box-shadow: inset 0 0 10px rgba(0,0,0,0.5);
-        }}
+        }
 
-        .slider-hook {{
+        .slider-hook {
             position: absolute;
             width: 20px;
             height: 40px;
@@ -254,17 +263,15 @@ def zipper_interface():
                 inset 0 0 10px rgba(0,0,0,0.5),
                 0 3px 5px rgba(0,0,0,0.3);
             transform: rotateZ(-5deg);
-        }}
+        }
 
         /* SIDE PANELS WITH STUNNING CARDS */
-        .side-panel {{
+        .side-panel {
             position: absolute;
             top: 0;
             width: calc(50vw - 36px);
             height: 100vh;
             background: linear-gradient(135deg, rgba(30, 30, 46, 0.95) 0%, rgba(42, 42, 58, 0.95) 100%);
-            backdrop-filter: blur(10px);
-            -webkit-backdrop-filter: blur(10px);
             border: 1px solid rgba(255, 255, 255, 0.1);
             box-shadow: 
                 inset 0 0 50px rgba(0,0,0,0.5),
@@ -279,30 +286,44 @@ def zipper_interface():
             overflow-x: hidden;
             transform-style: preserve-3d;
             transition: transform 0.4s cubic-bezier(0.16, 1, 0.3, 1), opacity 0.4s ease;
-        }}
+            backface-visibility: hidden;
+            --panel-scale: calc(1 + var(--panel-scale-delta) * var(--zip-progress));
+            opacity: calc(1 + var(--panel-opacity-delta) * var(--zip-progress));
+        }
 
-        .side-panel.left {{
+        /* The panels mirror each other; 3D translate/scale keep each on its own compositor layer while dragging */
+        .side-panel.left {
             left: 0;
             transform-origin: right center;
             border-right: none;
-        }}
+            transform:
+                translate3d(calc(var(--panel-shift) * -1 * var(--zip-progress)), 0, 0)
+                rotateY(calc(var(--panel-rotate-y) * var(--zip-progress)))
+                skewY(calc(var(--panel-skew-y) * -1 * var(--zip-progress)))
+                scale3d(var(--panel-scale), var(--panel-scale), 1);
+        }
 
-        .side-panel.right {{
+        .side-panel.right {
             right: 0;
             transform-origin: left center;
             border-left: none;
-        }}
+            transform:
+                translate3d(calc(var(--panel-shift) * var(--zip-progress)), 0, 0)
+                rotateY(calc(var(--panel-rotate-y) * -1 * var(--zip-progress)))
+                skewY(calc(var(--panel-skew-y) * var(--zip-progress)))
+                scale3d(var(--panel-scale), var(--panel-scale), 1);
+        }
 
         /* SECTION HEADERS */
-        .section-header {{
+        .section-header {
             width: 100%;
             text-align: center;
             margin: 1rem 0 2rem 0;
             position: relative;
             padding-bottom: 1rem;
-        }}
+        }
 
-        .section-header h2 {{
+        .section-header h2 {
             font-family: 'Playfair Display', serif;
             font-size: 2.5rem;
             font-weight: 700;
@@ -311,9 +332,9 @@ def zipper_interface():
             letter-spacing: 1px;
             position: relative;
             display: inline-block;
-        }}
+        }
 
-        .section-header h2::after {{
+        .section-header h2::after {
             content: "";
             position: absolute;
             bottom: -10px;
@@ -322,19 +343,19 @@ def zipper_interface():
             height: 3px;
             background: linear-gradient(90deg, transparent, #7b68ee, transparent);
             border-radius: 3px;
-        }}
+        }
 
         /* ULTRA-REALISTIC CARDS WITH ANIMATIONS */
-        .card-container {{
+        .card-container {
             width: 100%;
             display: flex;
             flex-direction: column;
             align-items: center;
             gap: 2rem;
             perspective: 1000px;
-        }}
+        }
 
-        .card {{
+        .card {
             width: 90%;
             min-height: 180px;
             background: linear-gradient(135deg, rgba(40, 40, 60, 0.8) 0%, rgba(30, 30, 50, 0.9) 100%);
@@ -348,18 +369,37 @@ def zipper_interface():
             transition: all 0.6s cubic-bezier(0.23, 1, 0.32, 1);
             position: relative;
             overflow: hidden;
-            opacity: 0;
-            transform: translateY(50px) rotateX(10deg);
+            transform: translateY(0) rotateX(0deg);
+            /* Entrance runs on the compositor from page load; 'backwards' holds the hidden start
+               state through each card's delay, and once finished the card falls back to these
+               base styles so :hover still applies */
+            animation: cardIn 0.6s cubic-bezier(0.23, 1, 0.32, 1) backwards;
             will-change: transform, opacity;
-        }}
+            backface-visibility: hidden;
+        }
+
+        .card[data-delay="0.1"] { animation-delay: 0.1s; }
+        .card[data-delay="0.2"] { animation-delay: 0.2s; }
+        .card[data-delay="0.3"] { animation-delay: 0.3s; }
+        .card[data-delay="0.4"] { animation-delay: 0.4s; }
+        .card[data-delay="0.5"] { animation-delay: 0.5s; }
+        .card[data-delay="0.6"] { animation-delay: 0.6s; }
+
+        @keyframes cardIn {
+            from {
+                opacity: 0;
+                transform: translate3d(0, 50px, 0) rotateX(10deg);
+            }
+        }
 
-        .card::before {{
+        .card::before {
             content: "";
             position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
+            /* Card-sized sheen swept across with a transform, so hover only re-composites */
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
             background: linear-gradient(
                 45deg,
                 transparent 0%,
@@ -368,22 +408,23 @@ def zipper_interface():
                 rgba(255, 255, 255, 0.03) 70%,
                 transparent 100%
             );
-            transform: rotate(45deg);
-            transition: all 0.6s ease;
-        }}
+            transform: translateX(-100%);
+            transition: transform 0.6s ease;
+        }
 
-        .card:hover {{
+        .card:hover {
             transform: translateY(-10px) scale(1.02) rotateX(0deg);
             box-shadow: 
                 0 15px 40px rgba(0, 0, 0, 0.4),
                 inset 0 0 30px rgba(255, 255, 255, 0.1);
-        }}
+        }
 
-        .card:hover::before {{
-            left: 100%;
-        }}
+        .card:hover::before {
+            transform: translateX(100%);
+            will-change: transform;
+        }
 
-        .card-header {{
+        .card-header {
             font-family: 'Playfair Display', serif;
             font-size: 1.8rem;
             font-weight: 700;
@@ -392,9 +433,9 @@ def zipper_interface():
             position: relative;
             display: inline-block;
             text-shadow: 0 2px 5px rgba(0,0,0,0.3);
-        }}
+        }
 
-        .card-header::after {{
+        .card-header::after {
             content: "";
             position: absolute;
             bottom: -5px;
@@ -403,16 +444,16 @@ def zipper_interface():
             height: 2px;
             background: linear-gradient(90deg, #7b68ee, transparent);
             border-radius: 2px;
-        }}
+        }
 
-        .card-content {{
+        .card-content {
             font-size: 1.1rem;
             line-height: 1.6;
             color: rgba(240, 240, 240, 0.9);
             margin-top: 1rem;
-        }}
+        }
 
-        .card-icon {{
+        .card-icon {
             position: absolute;
             top: 1.5rem;
             right: 1.5rem;
@@ -429,28 +470,28 @@ def zipper_interface():
                 0 0 0 2px rgba(123, 104, 238, 0.3),
                 inset 0 0 10px rgba(123, 104, 238, 0.2);
             transition: all 0.4s ease;
-        }}
+        }
 
-        .card:hover .card-icon {{
+        .card:hover .card-icon {
             transform: scale(1.1) rotate(10deg);
             box-shadow: 
                 0 0 0 4px rgba(123, 104, 238, 0.4),
                 inset 0 0 15px rgba(123, 104, 238, 0.3);
-        }}
+        }
 
-        /* PARTICLE EFFECTS */
-        .particle {{
+        /* PARTICLE EFFECTS: drawn on one canvas rather than one styled div per particle */
+        #particleCanvas {
             position: absolute;
-            width: 4px;
-            height: 4px;
-            background: rgba(255, 255, 255, 0.6);
-            border-radius: 50%;
+            top: 0;
+            left: 0;
+            width: 100vw;
+            height: 100vh;
             pointer-events: none;
             z-index: 1;
-        }}
+        }
 
         /* CHATBOT IFRAME CONTAINER */
-        .chatbot-container {{
+        .chatbot-container {
             position: absolute;
             top: 0;
             left: 0;
@@ -460,64 +501,82 @@ def zipper_interface():
             display: flex;
             justify-content: center;
             align-items: center;
-            opacity: 0;
+            opacity: min(1, calc(var(--chatbot-reveal-rate) * var(--zip-progress)));
             pointer-events: none;
             z-index: 1;
             transition: opacity 0.8s cubic-bezier(0.23, 1, 0.32, 1);
-        }}
+        }
 
-        .chatbot-container.revealed {{
+        .chatbot-container.revealed {
             opacity: 1;
             pointer-events: auto;
-        }}
+        }
+
+        /* Layer hints only while the zipper moves (body.dragging spans grab to end of snap),
+           so the large panel textures aren't pinned in GPU memory while the page sits idle */
+        body.dragging .side-panel,
+        body.dragging .zipper-slider,
+        body.dragging .chatbot-container {
+            will-change: transform, opacity;
+        }
 
-        #chatbotIframe {{
+        #chatbotIframe {
             width: 100%;
             height: 100%;
             border: none;
             background: transparent;
-        }}
+        }
 
         /* ANIMATION CLASSES */
-        @keyframes float {{
-            0%, 100% {{ transform: translateY(0) rotateX(0deg); }}
-            50% {{ transform: translateY(-10px) rotateX(5deg); }}
-        }}
+        @keyframes pulse {
+            0%, 100% { opacity: 0.6; }
+            50% { opacity: 1; }
+        }
 
-        @keyframes pulse {{
-            0%, 100% {{ opacity: 0.6; }}
-            50% {{ opacity: 1; }}
-        }}
+        /* Frosted panels only on large screens without a reduced-motion preference; the blur
+           resamples everything behind the panel whenever it moves, so it is also dropped
+           while the zipper is being dragged or is settling */
+        @media (prefers-reduced-motion: no-preference) and (min-width: 1200px) {
+            .side-panel {
+                backdrop-filter: blur(10px);
+                -webkit-backdrop-filter: blur(10px);
+            }
+            body.dragging .side-panel {
+                backdrop-filter: none;
+                -webkit-backdrop-filter: none;
+            }
+        }
 
         /* RESPONSIVE ADJUSTMENTS */
-        @media (max-width: 768px) {{
-            .side-panel {{
+        @media (max-width: 768px) {
+            .side-panel {
                 width: calc(50vw - 20px);
                 padding: 1rem;
-            }}
+            }
             
-            .card {{
+            .card {
                 width: 95%;
                 padding: 1.5rem;
-            }}
+            }
             
-            .section-header h2 {{
+            .section-header h2 {
                 font-size: 2rem;
-            }}
+            }
             
-            .card-header {{
+            .card-header {
                 font-size: 1.5rem;
-            }}
+            }
             
-            .card-content {{
+            .card-content {
                 font-size: 1rem;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
     <div class="main-container">
-        <!-- Particle effects will be added here by JS -->
+        <!-- Particle effects are drawn here by JS -->
+        <canvas id="particleCanvas"></canvas>
         
         <!-- Zipper Track -->
         <div class="zipper-track">
@@ -584,7 +643,7 @@ def zipper_interface():
         
         <!-- Chatbot Container -->
         <div class="chatbot-container" id="chatbotContainer">
-            <iframe id="chatbotIframe" src="about:blank"></iframe>
+            <iframe id="chatbotIframe" src="about:blank" loading="eager" fetchpriority="high"></iframe>
         </div>
     </div>
 
@@ -592,322 +651,394 @@ def zipper_interface():
         // DOM Elements
         const zipperSlider = document.getElementById('zipperSlider');
         const sliderPull = document.getElementById('sliderPull');
-        const leftPanel = document.getElementById('leftPanel');
-        const rightPanel = document.getElementById('rightPanel');
         const zipperTrack = document.querySelector('.zipper-track');
         const chatbotContainer = document.getElementById('chatbotContainer');
         const chatbotIframe = document.getElementById('chatbotIframe');
-        const cards = document.querySelectorAll('.card');
         const mainContainer = document.querySelector('.main-container');
+        const CHATBOT_URL = "http://localhost:8502";
+        const particleCanvas = document.getElementById('particleCanvas');
+        const particleCtx = particleCanvas.getContext('2d');
         
         // State variables
         let isDragging = false;
         let startY = 0;
-        let currentY = 0;
-        let maxY = window.innerHeight - zipperSlider.offsetHeight;
+        let dragOriginY = 0; // sliderY when the current drag began
+        // Viewport and slider sizes, refreshed only on resize so per-frame code never queries layout
+        let viewW = window.innerWidth;
+        let viewH = window.innerHeight;
+        let maxY = viewH - zipperSlider.offsetHeight;
         let momentum = 0;
         let lastY = 0;
         let deltaY = 0;
         let lastTime = 0;
-        let particles = [];
+        let sliderY = NaN; // Slider offset in px; kept here so it never has to be read back from the DOM (NaN until init places it)
+        
+        // Pull tab / chatbot class state mirrored in JS, so per-frame code neither reads
+        // classList nor touches it unless the state actually flips
+        let pullUp = false;
+        let chatbotRevealed = false;
+        function setPullUp(up) {
+            if (up === pullUp) return;
+            pullUp = up;
+            sliderPull.classList.toggle('up', up);
+        }
+        
+        // Position the slider with a compositor-only transform instead of 'top' (which forces layout)
+        function setSliderY(y) {
+            if (y === sliderY) return; // Already there; NaN never matches, so the first call always writes
+            sliderY = y;
+            zipperSlider.style.transform = `translate3d(-50%, ${y}px, 0)`;
+        }
+        
+        // Particle state as one contiguous typed array per field (structure of arrays), indexed
+        // by particle: allocated once, no per-particle objects for the GC to track
+        const PARTICLE_COUNT = 50;
+        const TWO_PI = Math.PI * 2;
+        const particleX = new Float32Array(PARTICLE_COUNT);
+        const particleY = new Float32Array(PARTICLE_COUNT);
+        const particleSize = new Float32Array(PARTICLE_COUNT);
+        const particleAlpha = new Float32Array(PARTICLE_COUNT);
+        const particlePhase = new Float32Array(PARTICLE_COUNT);
+        const particleBreathRate = new Float32Array(PARTICLE_COUNT);
+        const particleSpeed = new Float32Array(PARTICLE_COUNT);
+        const particleAngle = new Float32Array(PARTICLE_COUNT);
         
         // Initialize particles
-        function initParticles() {{
-            particles = []; // Clear existing particles
-            for (let i = 0; i < 50; i++) {{
-                createParticle();
-            }}
-        }}
+        function initParticles() {
+            for (let i = 0; i < PARTICLE_COUNT; i++) {
+                // Random position
+                particleX[i] = Math.random() * viewW;
+                particleY[i] = Math.random() * viewH;
                 
-        function createParticle() {{
-            const particle = document.createElement('div');
-            particle.className = 'particle';
-            
-            // Random position
-            const x = Math.random() * window.innerWidth;
-            const y = Math.random() * window.innerHeight;
-            
-            // Random size
-            const size = Math.random() * 3 + 1;
-            
-            // Random opacity
-            const opacity = Math.random() * 0.5 + 0.1;
-            
-            // Random animation
-            const duration = Math.random() * 10 + 5;
-            const delay = Math.random() * 5;
-            
-            particle.style.left = x + 'px';
-            particle.style.top = y + 'px';
-            particle.style.width = size + 'px';
-            particle.style.height = size + 'px';
-            particle.style.opacity = opacity;
-            particle.style.animation = 'float ' + duration + 's infinite ' + delay + 's';
-            
-            mainContainer.appendChild(particle);
-            particles.push({{
-                element: particle,
-                x: x,
-                y: y,
-                speed: Math.random() * 0.5 + 0.1,
-                angle: Math.random() * Math.PI * 2,
-                radius: Math.random() * 50 + 20
-            }});
-        }}
-
-        // Update particles
-        function updateParticles(time) {{
-            if (!particles || particles.length === 0) {{
-                requestAnimationFrame(updateParticles);
+                // Random size
+                particleSize[i] = Math.random() * 3 + 1;
+                
+                // Random opacity, in 0.1 steps so particles share a few canvas alpha states
+                particleAlpha[i] = (Math.floor(Math.random() * 5) + 1) / 10;
+                
+                // Random 5-15s "breathing" bob, applied in updateParticles instead of a CSS animation
+                const breathPeriod = (Math.random() * 10 + 5) * 1000;
+                particlePhase[i] = Math.random() * Math.PI * 2;
+                particleBreathRate[i] = (Math.PI * 2) / breathPeriod;
+                
+                particleSpeed[i] = Math.random() * 0.5 + 0.1;
+                particleAngle[i] = Math.random() * Math.PI * 2;
+            }
+            // Group equal opacities so the draw loop changes globalAlpha a handful of times per frame,
+            // not once per particle. Every other field is independently random, so sorting this one
+            // array on its own is equivalent to sorting whole particles.
+            particleAlpha.sort();
+        }
+
+        // Match the canvas backing store to the viewport
+        function sizeParticleCanvas() {
+            particleCanvas.width = viewW;
+            particleCanvas.height = viewH;
+            particleCtx.fillStyle = 'rgba(255, 255, 255, 0.6)'; // Resizing resets context state
+        }
+        
+        // Start the particle loop unless it is already running
+        let particleLoopRunning = false;
+        let particlesOnScreen = true; // False while the page is scrolled out of view in the host
+        function startParticles() {
+            if (particleLoopRunning) return;
+            particleLoopRunning = true;
+            requestAnimationFrame(updateParticles);
+        }
+        
+        // Update particles: move them, then redraw the whole canvas in one pass
+        function updateParticles(time) {
+            // Nothing to see while the tab is hidden, the page is offscreen or the chatbot covers it; stop
+            // rescheduling and let startParticles() resume on visibilitychange / intersection / zipper close
+            if (document.hidden || !particlesOnScreen || chatbotRevealed) {
+                particleLoopRunning = false;
                 return;
-            }}
+            }
             
-            particles.forEach(particle => {{
-                if (!particle || !particle.element) return;
-                
-                particle.angle += particle.speed * 0.01;
-                particle.x += Math.cos(particle.angle) * 0.2;
-                particle.y += Math.sin(particle.angle) * 0.2;
+            particleCtx.clearRect(0, 0, particleCanvas.width, particleCanvas.height);
+            let alpha = -1;
+            // Indexed loop over the typed arrays: no per-particle callback or object in the hottest loop on the page
+            for (let i = 0; i < PARTICLE_COUNT; i++) {
+                const angle = particleAngle[i] + particleSpeed[i] * 0.01;
+                particleAngle[i] = angle;
+                let x = particleX[i] + Math.cos(angle) * 0.2;
+                let y = particleY[i] + Math.sin(angle) * 0.2;
                 
                 // Wrap around screen edges
-                if (particle.x > window.innerWidth) particle.x = 0;
-                if (particle.x < 0) particle.x = window.innerWidth;
-                if (particle.y > window.innerHeight) particle.y = 0;
-                if (particle.y < 0) particle.y = window.innerHeight;
+                if (x > viewW) x = 0;
+                if (x < 0) x = viewW;
+                if (y > viewH) y = 0;
+                if (y < 0) y = viewH;
+                particleX[i] = x;
+                particleY[i] = y;
                 
-                particle.element.style.left = `${{particle.x}}px`;
-                particle.element.style.top = `${{particle.y}}px`;
-            }});
+                // One path per opacity level: globalAlpha applies when a path is filled, so fill the
+                // previous level before switching
+                if (particleAlpha[i] !== alpha) {
+                    if (alpha >= 0) particleCtx.fill();
+                    alpha = particleAlpha[i];
+                    particleCtx.globalAlpha = alpha;
+                    particleCtx.beginPath();
+                }
+                // Round, like the old border-radius: 50% particles; (x, y) stays the top-left of the dot
+                const bob = Math.sin(time * particleBreathRate[i] + particlePhase[i]) * 5;
+                const r = particleSize[i] / 2;
+                const cx = x + r;
+                const cy = y + bob + r;
+                particleCtx.moveTo(cx + r, cy);
+                particleCtx.arc(cx, cy, r, 0, TWO_PI);
+            }
+            particleCtx.fill();
             
             requestAnimationFrame(updateParticles);
-        }}
+        }
         
-        // Animate cards with staggered entrance
-        function animateCards() {{
-            cards.forEach(card => {{
-                const delay = parseFloat(card.getAttribute('data-delay'));
-                setTimeout(() => {{
-                    card.style.opacity = '1';
-                    card.style.transform = 'translateY(0) rotateX(0deg)';
-                }}, delay * 1000);
-            }});
-        }}
+        // Start loading the chatbot behind the panels; the container stays non-interactive until
+        // it is revealed. Called when a pointer first reaches the zipper, so by the time the panels
+        // part the page has had the hover-to-grab gap (and the whole drag) to load.
+        function loadChatbot() {
+            if (chatbotIframe.src === "about:blank") {
+                chatbotIframe.src = CHATBOT_URL;
+            }
+        }
         
         // Handle drag start
-        function handleDragStart(e) {{
+        function handleDragStart(e) {
             isDragging = true;
-            startY = e.clientY || e.touches[0].clientY;
-            currentY = parseFloat(zipperSlider.style.top || '0');
+            document.body.classList.add('dragging');
+            startY = e.clientY;
+            // Capture keeps the pointer's events on the slider even when it leaves it
+            zipperSlider.setPointerCapture(e.pointerId);
+            dragOriginY = sliderY;
             zipperSlider.style.cursor = 'grabbing';
-            sliderPull.classList.remove('up');
+            setPullUp(false);
+            
+            // Touch has no hover, so this is where touch users start the load
+            loadChatbot();
             
             // Add active state to zipper
-            zipperSlider.style.transform = 'translateX(-50%) scale(1.02)';
+            zipperSlider.classList.add('grabbed');
             
-            document.addEventListener('mousemove', handleDrag);
-            document.addEventListener('mouseup', handleDragEnd);
-            document.addEventListener('touchmove', handleDrag, {{ passive: false }});
-            document.addEventListener('touchend', handleDragEnd);
-        }}
+            // One pointer path for mouse, touch and pen; touch-action: none on the slider
+            // already stops scrolling, so none of these listeners need to block
+            zipperSlider.addEventListener('pointermove', handleDrag, { passive: true });
+            zipperSlider.addEventListener('pointerup', handleDragEnd, { passive: true });
+            zipperSlider.addEventListener('pointercancel', handleDragEnd, { passive: true });
+        }
         
-        // Handle dragging
-        function handleDrag(e) {{
+        // Handle dragging: pointer events can outpace the display, so keep only the
+        // latest one and apply it once per animation frame
+        let dragFramePending = false;
+        let lastDragY = 0;
+        let lastDragTime = 0;
+        function handleDrag(e) {
             if (!isDragging) return;
-            e.preventDefault();
-            
-            const clientY = e.clientY || e.touches[0].clientY;
-            const now = performance.now();
+            // The browser may batch several raw moves into one event; only the newest position matters
+            const coalesced = e.getCoalescedEvents ? e.getCoalescedEvents() : [];
+            const latest = coalesced.length ? coalesced[coalesced.length - 1] : e;
+            lastDragY = latest.clientY;
+            lastDragTime = latest.timeStamp; // When the pointer was there, for an accurate release velocity
+            if (!dragFramePending) {
+                dragFramePending = true;
+                requestAnimationFrame(() => {
+                    dragFramePending = false;
+                    if (isDragging) applyDrag(lastDragY, lastDragTime);
+                });
+            }
+        }
+        
+        function applyDrag(clientY, now) {
             deltaY = clientY - (lastY || startY);
             lastY = clientY;
             
-            if (lastTime) {{
+            if (lastTime) {
                 const deltaTime = now - lastTime;
-                if (deltaTime > 0) {{
+                if (deltaTime > 0) {
                     momentum = deltaY / deltaTime;
-                }}
-            }}
+                }
+            }
             lastTime = now;
             
-            let newY = currentY + (clientY - startY);
+            let newY = dragOriginY + (clientY - startY);
             newY = Math.max(0, Math.min(newY, maxY));
             
-            zipperSlider.style.top = `${{newY}}px`;
+            setSliderY(newY);
             updatePanels(newY);
-        }}
+        }
         
         // Handle drag end
-        function handleDragEnd() {{
+        function handleDragEnd() {
             isDragging = false;
             lastY = 0;
             lastTime = 0;
             zipperSlider.style.cursor = 'grab';
-            zipperSlider.style.transform = 'translateX(-50%) scale(1)';
+            zipperSlider.classList.remove('grabbed');
             
-            document.removeEventListener('mousemove', handleDrag);
-            document.removeEventListener('mouseup', handleDragEnd);
-            document.removeEventListener('touchmove', handleDrag);
-            document.removeEventListener('touchend', handleDragEnd);
+            zipperSlider.removeEventListener('pointermove', handleDrag);
+            zipperSlider.removeEventListener('pointerup', handleDragEnd);
+            zipperSlider.removeEventListener('pointercancel', handleDragEnd);
             
             // Apply momentum
-            if (Math.abs(momentum) > 0.1) {{
+            if (Math.abs(momentum) > 0.1) {
                 applyMomentum();
-            }} else {{
+            } else {
                 checkSnapPosition();
-            }}
-        }}
+            }
+        }
         
         // Apply momentum after drag
-        function applyMomentum() {{
+        function applyMomentum() {
             const deceleration = 0.95;
             const threshold = 0.1;
             
-            if (Math.abs(momentum) > threshold) {{
-                let currentTop = parseFloat(zipperSlider.style.top || '0');
-                let newTop = currentTop + momentum * 20;
+            if (Math.abs(momentum) > threshold) {
+                let newTop = sliderY + momentum * 20;
                 
                 newTop = Math.max(0, Math.min(newTop, maxY));
                 
-                zipperSlider.style.top = `${{newTop}}px`;
+                setSliderY(newTop);
                 updatePanels(newTop);
                 
                 momentum *= deceleration;
                 requestAnimationFrame(applyMomentum);
-            }} else {{
+            } else {
                 checkSnapPosition();
-            }}
-        }}
+            }
+        }
         
         // Check if zipper should snap to open or closed position
-        function checkSnapPosition() {{
-            const currentTop = parseFloat(zipperSlider.style.top || '0');
+        function checkSnapPosition() {
+            const currentTop = sliderY;
             const openThreshold = maxY * 0.7;
             
-            if (currentTop >= openThreshold) {{
+            if (currentTop >= openThreshold) {
                 // Snap to open
-                animateTo(maxY, () => {{
-                    sliderPull.classList.add('up');
+                animateTo(maxY, () => {
+                    setPullUp(true);
+                    chatbotRevealed = true;
                     chatbotContainer.classList.add('revealed');
                     zipperSlider.style.opacity = '0';
                     zipperSlider.style.pointerEvents = 'none';
                     zipperTrack.style.opacity = '0';
                     
                     // Load chatbot iframe
-                    if (chatbotIframe.src === "about:blank") {{
-                        chatbotIframe.src = "http://localhost:8502";
-                    }}
-                }});
-            }} else {{
+                    loadChatbot();
+                });
+            } else {
                 // Snap to closed
-                animateTo(0, () => {{
-                    sliderPull.classList.remove('up');
+                animateTo(0, () => {
+                    setPullUp(false);
+                    chatbotRevealed = false;
                     chatbotContainer.classList.remove('revealed');
+                    startParticles();
                     zipperSlider.style.opacity = '1';
                     zipperSlider.style.pointerEvents = 'auto';
                     zipperTrack.style.opacity = '1';
                     
                     // Unload iframe
-                    if (chatbotIframe.src !== "about:blank") {{
+                    if (chatbotIframe.src !== "about:blank") {
                         chatbotIframe.src = "about:blank";
-                    }}
-                }});
-            }}
-        }}
+                    }
+                });
+            }
+        }
         
         // Smooth animation to target position
-        function animateTo(target, callback) {{
-            const start = parseFloat(zipperSlider.style.top || '0');
+        function animateTo(target, callback) {
+            const start = sliderY;
             const duration = 500; // ms
             const startTime = performance.now();
             
-            function step(currentTime) {{
+            function step(currentTime) {
                 const elapsed = currentTime - startTime;
                 const progress = Math.min(elapsed / duration, 1);
-                const easeProgress = easeOutCubic(progress);
+                const easeProgress = EASE_OUT_CUBIC[(progress * 256) | 0];
                 const newTop = start + (target - start) * easeProgress;
                 
-                zipperSlider.style.top = `${{newTop}}px`;
+                setSliderY(newTop);
                 updatePanels(newTop);
                 
-                if (progress < 1) {{
+                if (progress < 1) {
                     requestAnimationFrame(step);
-                }} else if (callback) {{
-                    callback();
-                }}
-            }}
+                } else {
+                    document.body.classList.remove('dragging'); // Panels are at rest again
+                    if (callback) callback();
+                }
+            }
             
             requestAnimationFrame(step);
-        }}
+        }
         
-        // Easing function
-        function easeOutCubic(t) {{
-            return 1 - Math.pow(1 - t, 3);
-        }}
+        // Ease-out cubic (1 - (1 - t)^3) sampled once at 257 points; animateTo indexes it per frame
+        const EASE_OUT_CUBIC = new Float32Array(257);
+        for (let i = 0; i <= 256; i++) {
+            const t = i / 256;
+            EASE_OUT_CUBIC[i] = 1 - (1 - t) * (1 - t) * (1 - t);
+        }
         
-        // Update panel positions based on zipper position
-        function updatePanels(zipperTop) {{
+        // Update panel positions based on zipper position. Everything written below depends
+        // only on progress, so a frame that lands on the same progress (slider pinned at
+        // either end during a drag or momentum) skips the whole write phase.
+        let lastPanelProgress = NaN;
+        function updatePanels(zipperTop) {
             const progress = zipperTop / maxY;
+            if (progress === lastPanelProgress) return;
+            lastPanelProgress = progress;
             
-            // Calculate panel transformations
-            const leftPanelX = -progress * 100;
-            const rightPanelX = progress * 100;
-            const panelRotateY = progress * 15;
-            const panelSkewY = progress * 5;
-            const panelOpacity = 1 - progress * 1.5;
-            const panelScale = 1 - progress * 0.2;
-            
-            // Apply transformations
-            leftPanel.style.transform = `
-                translateX(${{leftPanelX}}vw) 
-                rotateY(${{panelRotateY}}deg) 
-                skewY(${{-panelSkewY}}deg) 
-                scale(${{panelScale}})
-            `;
-            rightPanel.style.transform = `
-                translateX(${{rightPanelX}}vw) 
-                rotateY(${{-panelRotateY}}deg) 
-                skewY(${{panelSkewY}}deg) 
-                scale(${{panelScale}})
-            `;
-            
-            leftPanel.style.opacity = panelOpacity;
-            rightPanel.style.opacity = panelOpacity;
-            
-            // Update chatbot container opacity
-            chatbotContainer.style.opacity = Math.min(1, progress * 1.5);
+            // One custom-property write; the CSS derives both panels' transform/opacity and the
+            // chatbot fade from it (see --zip-progress on .main-container)
+            mainContainer.style.setProperty('--zip-progress', progress);
             
             // Update pull tab state
-            if (progress > 0.1) {{
-                sliderPull.classList.add('up');
-            }} else {{
-                sliderPull.classList.remove('up');
-            }}
-        }}
+            setPullUp(progress > 0.1);
+        }
         
         // Handle window resize
-        function handleResize() {{
-            maxY = window.innerHeight - zipperSlider.offsetHeight;
-            const currentTop = parseFloat(zipperSlider.style.top || '0');
-            updatePanels(currentTop);
-        }}
+        function handleResize() {
+            viewW = window.innerWidth;
+            viewH = window.innerHeight;
+            maxY = viewH - zipperSlider.offsetHeight;
+            sizeParticleCanvas();
+            updatePanels(sliderY);
+        }
+        
+        // Resize fires at event rate while the window is dragged; measure at most once per frame
+        let resizePending = false;
+        function scheduleResize() {
+            if (resizePending) return;
+            resizePending = true;
+            requestAnimationFrame(() => {
+                resizePending = false;
+                handleResize();
+            });
+        }
         
         // Initialize
-        function init() {{
-            maxY = window.innerHeight - zipperSlider.offsetHeight;
-            zipperSlider.style.top = '0px';
-            updatePanels(0);
+        function init() {
+            setSliderY(0);
+            handleResize(); // Measures the viewport, sizes the canvas and lays out the panels at sliderY = 0
             
-            zipperSlider.addEventListener('mousedown', handleDragStart);
-            zipperSlider.addEventListener('touchstart', handleDragStart, {{ passive: false }});
-            window.addEventListener('resize', handleResize);
+            // Nothing on the drag path calls preventDefault (touch-action: none on the slider keeps the page
+            // from scrolling under it), so every listener is passive and never holds up the compositor
+            zipperSlider.addEventListener('pointerdown', handleDragStart, { passive: true });
+            zipperSlider.addEventListener('pointerenter', loadChatbot, { passive: true });
+            window.addEventListener('resize', scheduleResize, { passive: true });
             
             // Initialize animations
             initParticles();
-            animateCards();
-            // Don't call updateParticles() here - it's already called at the end of initParticles
-            
-            // Add floating animation to zipper
-            zipperSlider.style.animation = 'float 4s ease-in-out infinite';
-        }}
+            startParticles();
+            document.addEventListener('visibilitychange', () => {
+                if (!document.hidden) startParticles();
+            });
+            // The host page can scroll this iframe out of view without hiding the tab
+            if ('IntersectionObserver' in window) {
+                new IntersectionObserver((entries) => {
+                    particlesOnScreen = entries[entries.length - 1].isIntersecting;
+                    if (particlesOnScreen) startParticles();
+                }).observe(particleCanvas);
+            }
+
+        }
         
         // Start everything when DOM is loaded
         document.addEventListener('DOMContentLoaded', init);
@@ -916,6 +1047,26 @@ def zipper_interface():
 </html>
 """
 
+def minify_markup(markup):
+    # Stdlib-only squeeze: drop CSS/HTML comments, indentation, blank lines and whole-line JS comments.
+    # Line breaks are kept, so JS semicolon insertion and trailing // comments stay safe.
+    markup = re.sub(r"/\*.*?\*/", "", markup, flags=re.S)
+    markup = re.sub(r"<!--.*?-->", "", markup, flags=re.S)
+    lines = (line.strip() for line in markup.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+# Streamlit re-executes this script on every rerun, so the minified page is cached per process;
+# this is what ships to the browser
+@st.cache_resource(show_spinner=False)
+def zipper_interface():
+    return minify_markup(ZIPPER_HTML)
+
+@st.cache_resource(show_spinner=False) # The sheet lives in static/app.css; read it once per process, not per rerun
+def host_css():
+    # Inlined rather than <link>ed: Streamlit's static route serves .css as text/plain + nosniff, which browsers refuse
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "app.css"), encoding="utf-8") as f:
+        return f"<style>{f.read()}</style>"
+
 def main():
     st.set_page_config(
         layout="wide", 
@@ -923,29 +1074,8 @@ def main():
         page_title="Ultra-Realistic 3D Zipper Interface"
     )
     
-    st.markdown("""
-        <style>
-            .stApp {
-                padding: 0 !important;
-                margin: 0 !important;
-                max-width: 100% !important;
-            }
-            .block-container {
-                padding: 0 !important;
-            }
-            header[data-testid="stHeader"] {
-                display: none !important;
-            }
-            iframe {
-                width: 100vw !important;
-                height: 100vh !important;
-                display: block !important;
-                margin: 0 !important;
-                padding: 0 !important;
-                border: none !important;
-            }
-        </style>
-    """, unsafe_allow_html=True)
+    # Emitted on every run: an element skipped on a rerun is removed from the page along with its styles.
+    st.markdown(host_css(), unsafe_allow_html=True)
     
     html(zipper_interface(), height=1200, scrolling=False)
 